@@ -2,19 +2,65 @@
 
 from __future__ import annotations
 
+import functools
+import json
+import sys
+from io import BytesIO
 from pathlib import Path
 from typing import Any, Callable, Iterable
 
 import requests
+from jsonpath_ng.ext import parse as parse_jsonpath
 from singer_sdk.authenticators import BasicAuthenticator, BearerTokenAuthenticator
-from singer_sdk.helpers.jsonpath import extract_jsonpath
 from singer_sdk.pagination import BaseAPIPaginator
 from singer_sdk.streams import RESTStream
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None
+
 _Auth = Callable[[requests.PreparedRequest], requests.PreparedRequest]
 SCHEMAS_DIR = Path(__file__).parent / Path("./schemas")
 
 
+def _share_repeated_subtrees(schema: dict) -> dict:
+    """
+    Rebuilds a schema dict with structurally equal subtrees shared by
+    reference; the issues schema repeats the same item/ADF nodes hundreds
+    of times and schema dicts are treated as read-only after this point
+    """
+    pool: dict[str, Any] = {}
+
+    def share(node: Any) -> Any:
+        if isinstance(node, dict):
+            node = {key: share(value) for key, value in node.items()}
+        elif isinstance(node, list):
+            node = [share(item) for item in node]
+        else:
+            return node
+        key = json.dumps(node, sort_keys=True)
+        cached = pool.get(key)
+        if cached is None:
+            pool[key] = cached = node
+        return cached
+
+    return share(schema)
+
+
+@functools.cache
+def _compile_jsonpath(expression: str):
+    """
+    Compiles a JSONPath expression once and reuses it across responses
+    """
+    return parse_jsonpath(expression)
+
+
 class JiraStream(RESTStream):
     """tap-jira stream class."""
 
@@ -27,7 +73,86 @@ class JiraStream(RESTStream):
     # Set this value or override `get_new_paginator`.
     next_page_token_jsonpath = "$.next_page"
 
+    # Page size requested via maxResults; None keeps the endpoint default.
+    # Streams with small records can raise it to cut HTTP round-trips,
+    # streams with huge records can lower it to keep parses short.
+    page_size: int | None = None
+
+    @classmethod
+    def _build_schema(cls) -> dict:
+        """
+        Builds the stream's JSON schema dict; overridden per stream
+        """
+        raise NotImplementedError
+
+    @classmethod
+    @functools.cache
+    def _schema_dict(cls) -> dict:
+        """
+        Returns the schema dict for this class, building it only once.
+        Streams pre-serialized by tools/gen_schemas.py load the JSON file
+        instead of re-running the typing-helper builders.
+        """
+        schema_path = SCHEMAS_DIR / f"{cls.name}.json"
+        if schema_path.is_file():
+            return _share_repeated_subtrees(json.loads(schema_path.read_text()))
+        return _share_repeated_subtrees(cls._build_schema())
+
     @property
+    def schema(self) -> dict:
+        """
+        Returns the stream schema, built lazily on first access
+        """
+        schema = getattr(self, "_schema", None)
+        if schema is None:
+            schema = self._schema_dict()
+            self._schema = schema
+        return schema
+
+    # One shared HTTP session with a larger connection pool, so TLS
+    # connections are reused across streams and worker threads instead of
+    # re-handshaking per stream.
+    _shared_session: requests.Session | None = None
+
+    @property
+    def requests_session(self) -> requests.Session:
+        """Get requests session.
+
+        Returns:
+            The `requests.Session`_ object for HTTP requests, shared across
+            all streams of the tap.
+        """
+        if JiraStream._shared_session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=16,
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            JiraStream._shared_session = session
+        return JiraStream._shared_session
+
+    # Mapping of record key -> context key stamped onto every record.
+    # Child streams declare their parent-id column here instead of each
+    # overriding post_process with the same one-line method.
+    context_fields: dict[str, str] = {}
+
+    def post_process(self, row: dict, context: dict | None = None) -> dict | None:
+        """Copy any configured context fields onto the record.
+
+        Args:
+            row: An individual record from the stream.
+            context: The stream context.
+
+        Returns:
+            The updated record dictionary, or ``None`` to skip the record.
+        """
+        for field, context_key in self.context_fields.items():
+            row[field] = context[context_key]
+        return row
+
+    @functools.cached_property
     def url_base(self) -> str:
         """
         Returns base url
@@ -71,6 +196,92 @@ class JiraStream(RESTStream):
         # headers["Private-Token"] = self.config.get("auth_token")  # noqa: ERA001
         return headers
 
+    @staticmethod
+    def _decode_response(response: requests.Response) -> Any:
+        """
+        Decodes a response body, with orjson when it is available
+        """
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+
+    # Response size above which record pages are decoded incrementally.
+    _STREAM_PARSE_MIN_BYTES = 1 << 20
+
+    def parse_response(self, response: requests.Response) -> Iterable[dict]:
+        """Parse the response and return an iterator of result records.
+
+        Args:
+            response: The HTTP ``requests.Response`` object.
+
+        Yields:
+            Each record from the source.
+        """
+        instance_name = getattr(self, "instance_name", "")
+        if instance_name and self.records_jsonpath == "$[{}][*]".format(instance_name):
+            if (
+                ijson is not None
+                and len(response.content) >= self._STREAM_PARSE_MIN_BYTES
+            ):
+                # Large issue pages are yielded record by record instead of
+                # materializing the whole page dict up front. use_float keeps
+                # non-integer numbers as floats instead of decimal.Decimal,
+                # which the JSON emit paths cannot serialize as numbers.
+                yield from ijson.items(
+                    BytesIO(response.content), f"{instance_name}.item", use_float=True
+                )
+                return
+            data = self._decode_response(response)
+            if isinstance(data, dict):
+                # The records live under a single top-level key; index it
+                # directly instead of running the JSONPath engine.
+                yield from data.get(instance_name) or []
+                return
+
+        data = self._decode_response(response)
+        if self.records_jsonpath == "$[*]" and isinstance(data, list):
+            # A bare top-level array needs no JSONPath walk at all.
+            yield from data
+            return
+
+        compiled = _compile_jsonpath(self.records_jsonpath)
+        for match in compiled.find(data):
+            yield match.value
+
+    def _write_record_message(self, record: dict) -> None:
+        """Write out a RECORD message.
+
+        Serialized with orjson when it is available; issue records carry
+        large ADF trees and stdlib serialization dominates emit time.
+
+        Args:
+            record: A single stream record.
+        """
+        if orjson is None:
+            super()._write_record_message(record)
+            return
+
+        buffer = sys.stdout.buffer
+        for record_message in self._generate_record_messages(record):
+            buffer.write(orjson.dumps(record_message.to_dict(), default=str) + b"\n")
+        buffer.flush()
+
+    def _write_schema_message(self) -> None:
+        """Write out a SCHEMA message.
+
+        Serialized with orjson when it is available; the issues schema in
+        particular is a large nested dict and stdlib serialization is the
+        bulk of what discovery-time emission costs.
+        """
+        if orjson is None:
+            super()._write_schema_message()
+            return
+
+        buffer = sys.stdout.buffer
+        for schema_message in self._generate_schema_messages():
+            buffer.write(orjson.dumps(schema_message.to_dict(), default=str) + b"\n")
+        buffer.flush()
+
     def get_url_params(
         self,
         context: dict | None,
@@ -86,8 +297,14 @@ class JiraStream(RESTStream):
             A dictionary of URL query parameters.
         """
         params: dict = {}
+        if self.page_size:
+            params["maxResults"] = self.page_size
         if next_page_token:
-            params["startAt"] = next_page_token
+            if isinstance(next_page_token, str):
+                # Cursor handed out by the endpoint; constant-time on the server.
+                params["nextPageToken"] = next_page_token
+            else:
+                params["startAt"] = next_page_token
         if self.replication_key:
             params["sort"] = "asc"
             params["order_by"] = self.replication_key
@@ -103,7 +320,19 @@ class JiraStream(RESTStream):
         # If pagination is required, return a token which can be used to get the
         #       next page. If this is the final page, return "None" to end the
         #       pagination loop.
-        resp_json = response.json()
+        resp_json = self._decode_response(response)
+
+        if isinstance(resp_json, dict):
+            # Prefer the server-side cursor when the endpoint provides one;
+            # offset paging below stays as the fallback.
+            next_page_token = resp_json.get("nextPageToken")
+            if next_page_token:
+                return next_page_token
+
+        if isinstance(previous_token, str):
+            # Cursor-paged endpoint ran out of pages; the offset fallback
+            # does not apply to string cursors.
+            return None
 
         if previous_token is None:
             previous_token = 0
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import functools
+import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 from singer_sdk import typing as th  # JSON Schema typing helpers
+from singer_sdk.exceptions import FatalAPIError
 
 from tap_jira.client import JiraStream
 
@@ -23,9 +27,58 @@ IntegerType = th.IntegerType
 NumberType = th.NumberType
 role = {}
 
+# Shared placeholder schema for helper-stream instances that only fetch
+# records and never emit their own SCHEMA message; the SDK keeps schemas
+# by reference, so one dict serves every instantiation.
+_EMPTY_SCHEMA: dict = {"properties": {}}
+
+# Sub-schemas repeated across streams; the same typing-helper instance is
+# shared by reference since ``to_dict()`` never mutates it.
+_AVATAR_URLS = ObjectType(
+    Property("48x48", StringType),
+    Property("24x24", StringType),
+    Property("16x16", StringType),
+    Property("32x32", StringType),
+)
+
+_STATUS_CATEGORY = ObjectType(
+    Property("self", StringType),
+    Property("id", IntegerType),
+    Property("key", StringType),
+    Property("colorName", StringType),
+    Property("name", StringType),
+)
+
+_STATUS = ObjectType(
+    Property("self", StringType),
+    Property("description", StringType),
+    Property("iconUrl", StringType),
+    Property("name", StringType),
+    Property("id", StringType),
+    Property("statusCategory", _STATUS_CATEGORY),
+)
+
+_PRIORITY = ObjectType(
+    Property("self", StringType),
+    Property("iconUrl", StringType),
+    Property("name", StringType),
+    Property("id", StringType),
+)
+
+_ISSUETYPE = ObjectType(
+    Property("self", StringType),
+    Property("id", StringType),
+    Property("description", StringType),
+    Property("iconUrl", StringType),
+    Property("name", StringType),
+    Property("subtask", BooleanType),
+    Property("avatarId", IntegerType),
+    Property("entityId", StringType),
+    Property("hierarchyLevel", IntegerType),
+)
 
-class UsersStream(JiraStream):
 
+class UsersStream(JiraStream):
     """
     https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-users/#api-rest-api-3-user-get
     """
@@ -40,33 +93,28 @@ class UsersStream(JiraStream):
 
     name = "users"
     path = "/users/search"
+    page_size = 1000
     primary_keys = ["accountId"]
     replication_key = "accountId"
     replication_method = "INCREMENTAL"
     records_jsonpath = "$[*]"
     next_page_token_jsonpath = None
 
-    schema = PropertiesList(
-        Property("self", StringType),
-        Property("key", StringType),
-        Property("accountId", StringType),
-        Property("accountType", StringType),
-        Property("emailAddress", StringType),
-        Property("name", StringType),
-        Property(
-            "avatarUrls",
-            ObjectType(
-                Property("48x48", StringType),
-                Property("24x24", StringType),
-                Property("16x16", StringType),
-                Property("32x32", StringType),
-            ),
-        ),
-        Property("displayName", StringType),
-        Property("active", BooleanType),
-        Property("timeZone", StringType),
-        Property("locale", StringType),
-    ).to_dict()
+    @classmethod
+    def _build_schema(cls) -> dict:
+        return PropertiesList(
+            Property("self", StringType),
+            Property("key", StringType),
+            Property("accountId", StringType),
+            Property("accountType", StringType),
+            Property("emailAddress", StringType),
+            Property("name", StringType),
+            Property("avatarUrls", _AVATAR_URLS),
+            Property("displayName", StringType),
+            Property("active", BooleanType),
+            Property("timeZone", StringType),
+            Property("locale", StringType),
+        ).to_dict()
 
     def get_next_page_token(
         self,
@@ -77,19 +125,14 @@ class UsersStream(JiraStream):
         # If pagination is required, return a token which can be used to get the
         #       next page. If this is the final page, return "None" to end the
         #       pagination loop.
-        resp_json = response.json()
-        if previous_token is None:
-            previous_token = 0
-
-        page = resp_json
-        if len(page) == 0:
+        page_size = len(self._decode_response(response))
+        if not page_size:
             return None
 
-        return previous_token + len(page)
+        return (previous_token or 0) + page_size
 
 
 class FieldStream(JiraStream):
-
     """
     https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-issue-fields/#api-rest-api-3-field-get
     """
@@ -110,55 +153,56 @@ class FieldStream(JiraStream):
     replication_method = "INCREMENTAL"
     instance_name = ""
 
-    schema = PropertiesList(
-        Property("id", StringType),
-        Property("key", StringType),
-        Property("name", StringType),
-        Property("untranslatedName", StringType),
-        Property("custom", BooleanType),
-        Property("orderable", BooleanType),
-        Property("navigable", BooleanType),
-        Property("searchable", BooleanType),
-        Property("clauseNames", ArrayType(StringType)),
-        Property(
-            "scope",
-            ObjectType(
-                Property("type", StringType),
-                Property(
-                    "project",
-                    ObjectType(
-                        Property("id", StringType),
+    @classmethod
+    def _build_schema(cls) -> dict:
+        return PropertiesList(
+            Property("id", StringType),
+            Property("key", StringType),
+            Property("name", StringType),
+            Property("untranslatedName", StringType),
+            Property("custom", BooleanType),
+            Property("orderable", BooleanType),
+            Property("navigable", BooleanType),
+            Property("searchable", BooleanType),
+            Property("clauseNames", ArrayType(StringType)),
+            Property(
+                "scope",
+                ObjectType(
+                    Property("type", StringType),
+                    Property(
+                        "project",
+                        ObjectType(
+                            Property("id", StringType),
+                        ),
                     ),
                 ),
             ),
-        ),
-        Property(
-            "schema",
-            ObjectType(
-                Property("type", StringType),
-                Property("system", StringType),
-                Property("items", StringType),
-                Property("custom", StringType),
-                Property("customId", IntegerType),
-                Property(
-                    "configuration",
-                    ObjectType(
-                        Property("customRenderer", BooleanType),
-                        Property("readOnly", BooleanType),
-                        Property("environment", StringType),
-                        Property(
-                            "com.atlassian.jira.plugin.system.customfieldtypes:atlassian-team",
-                            BooleanType,
+            Property(
+                "schema",
+                ObjectType(
+                    Property("type", StringType),
+                    Property("system", StringType),
+                    Property("items", StringType),
+                    Property("custom", StringType),
+                    Property("customId", IntegerType),
+                    Property(
+                        "configuration",
+                        ObjectType(
+                            Property("customRenderer", BooleanType),
+                            Property("readOnly", BooleanType),
+                            Property("environment", StringType),
+                            Property(
+                                "com.atlassian.jira.plugin.system.customfieldtypes:atlassian-team",
+                                BooleanType,
+                            ),
                         ),
                     ),
                 ),
             ),
-        ),
-    ).to_dict()
+        ).to_dict()
 
 
 class ServerInfoStream(JiraStream):
-
     """
     https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-server-info/#api-rest-api-3-serverinfo-get
     """
@@ -178,27 +222,28 @@ class ServerInfoStream(JiraStream):
     replication_method = "INCREMENTAL"
     instance_name = ""
 
-    schema = PropertiesList(
-        Property("baseUrl", StringType),
-        Property("version", StringType),
-        Property("versionNumbers", ArrayType(IntegerType)),
-        Property("deploymentType", StringType),
-        Property("buildNumber", IntegerType),
-        Property("buildDate", StringType),
-        Property("serverTime", StringType),
-        Property("scmInfo", StringType),
-        Property("serverTitle", StringType),
-        Property(
-            "defaultLocale",
-            ObjectType(
-                Property("locale", StringType),
+    @classmethod
+    def _build_schema(cls) -> dict:
+        return PropertiesList(
+            Property("baseUrl", StringType),
+            Property("version", StringType),
+            Property("versionNumbers", ArrayType(IntegerType)),
+            Property("deploymentType", StringType),
+            Property("buildNumber", IntegerType),
+            Property("buildDate", StringType),
+            Property("serverTime", StringType),
+            Property("scmInfo", StringType),
+            Property("serverTitle", StringType),
+            Property(
+                "defaultLocale",
+                ObjectType(
+                    Property("locale", StringType),
+                ),
             ),
-        ),
-    ).to_dict()
+        ).to_dict()
 
 
 class IssueTypeStream(JiraStream):
-
     """
     https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-issue-types/#api-rest-api-3-issuetype-get
     """
@@ -220,35 +265,36 @@ class IssueTypeStream(JiraStream):
     records_jsonpath = "$[*]"  # Or override `parse_response`.
     instance_name = ""
 
-    schema = PropertiesList(
-        Property("self", StringType),
-        Property("id", StringType),
-        Property("description", StringType),
-        Property("iconUrl", StringType),
-        Property("name", StringType),
-        Property("untranslatedName", StringType),
-        Property("subtask", BooleanType),
-        Property("avatarId", IntegerType),
-        Property("hierarchyLevel", IntegerType),
-        Property(
-            "scope",
-            ObjectType(
-                Property("type", StringType),
-                Property(
-                    "project",
-                    ObjectType(
-                        Property("id", StringType),
-                        Property("key", StringType),
-                        Property("name", StringType),
+    @classmethod
+    def _build_schema(cls) -> dict:
+        return PropertiesList(
+            Property("self", StringType),
+            Property("id", StringType),
+            Property("description", StringType),
+            Property("iconUrl", StringType),
+            Property("name", StringType),
+            Property("untranslatedName", StringType),
+            Property("subtask", BooleanType),
+            Property("avatarId", IntegerType),
+            Property("hierarchyLevel", IntegerType),
+            Property(
+                "scope",
+                ObjectType(
+                    Property("type", StringType),
+                    Property(
+                        "project",
+                        ObjectType(
+                            Property("id", StringType),
+                            Property("key", StringType),
+                            Property("name", StringType),
+                        ),
                     ),
                 ),
             ),
-        ),
-    ).to_dict()
+        ).to_dict()
 
 
 class WorkflowStatusStream(JiraStream):
-
     """
     https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-workflow-statuses/#api-rest-api-3-status-get
     """
@@ -268,40 +314,32 @@ class WorkflowStatusStream(JiraStream):
     replication_method = "INCREMENTAL"
     instance_name = ""
 
-    schema = PropertiesList(
-        Property("self", StringType),
-        Property("description", StringType),
-        Property("iconUrl", StringType),
-        Property("name", StringType),
-        Property("untranslatedName", StringType),
-        Property("id", StringType),
-        Property(
-            "statusCategory",
-            ObjectType(
-                Property("self", StringType),
-                Property("id", IntegerType),
-                Property("key", StringType),
-                Property("colorName", StringType),
-                Property("name", StringType),
-            ),
-        ),
-        Property(
-            "scope",
-            ObjectType(
-                Property("type", StringType),
-                Property(
-                    "project",
-                    ObjectType(
-                        Property("id", StringType),
+    @classmethod
+    def _build_schema(cls) -> dict:
+        return PropertiesList(
+            Property("self", StringType),
+            Property("description", StringType),
+            Property("iconUrl", StringType),
+            Property("name", StringType),
+            Property("untranslatedName", StringType),
+            Property("id", StringType),
+            Property("statusCategory", _STATUS_CATEGORY),
+            Property(
+                "scope",
+                ObjectType(
+                    Property("type", StringType),
+                    Property(
+                        "project",
+                        ObjectType(
+                            Property("id", StringType),
+                        ),
                     ),
                 ),
             ),
-        ),
-    ).to_dict()
+        ).to_dict()
 
 
 class ProjectStream(JiraStream):
-
     """
     https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-projects/#api-rest-api-3-project-get
     """
@@ -323,54 +361,493 @@ class ProjectStream(JiraStream):
     records_jsonpath = "$[values][*]"  # Or override `parse_response`.
     instance_name = "values"
 
-    schema = PropertiesList(
-        Property("expand", StringType),
-        Property("self", StringType),
-        Property("id", StringType),
-        Property("key", StringType),
-        Property("name", StringType),
-        Property(
-            "avatarUrls",
-            ObjectType(
-                Property("48x48", StringType),
-                Property("24x24", StringType),
-                Property("16x16", StringType),
-                Property("32x32", StringType),
+    @classmethod
+    def _build_schema(cls) -> dict:
+        return PropertiesList(
+            Property("expand", StringType),
+            Property("self", StringType),
+            Property("id", StringType),
+            Property("key", StringType),
+            Property("name", StringType),
+            Property("avatarUrls", _AVATAR_URLS),
+            Property("projectTypeKey", StringType),
+            Property("simplified", BooleanType),
+            Property("style", StringType),
+            Property("isPrivate", BooleanType),
+            Property(
+                "properties",
+                ObjectType(
+                    Property("propertyKey", StringType),
+                ),
             ),
-        ),
-        Property("projectTypeKey", StringType),
-        Property("simplified", BooleanType),
-        Property("style", StringType),
-        Property("isPrivate", BooleanType),
-        Property(
-            "properties",
-            ObjectType(
-                Property("propertyKey", StringType),
+            Property("entityId", StringType),
+            Property("uuid", StringType),
+            Property(
+                "projectCategory",
+                ObjectType(
+                    Property("self", StringType),
+                    Property("id", StringType),
+                    Property("name", StringType),
+                    Property("description", StringType),
+                ),
             ),
-        ),
-        Property("entityId", StringType),
-        Property("uuid", StringType),
-        Property(
-            "projectCategory",
-            ObjectType(
-                Property("self", StringType),
-                Property("id", StringType),
-                Property("name", StringType),
-                Property("description", StringType),
+            Property(
+                "insight",
+                ObjectType(
+                    Property("totalIssueCount", IntegerType),
+                    Property("lastIssueUpdateTime", StringType),
+                ),
             ),
-        ),
+        ).to_dict()
+
+
+_ADF_ATTRS = ObjectType(
+    Property("href", StringType),
+    Property("colspan", IntegerType),
+    Property("alt", StringType),
+    Property("timestamp", StringType),
+    Property("colwidth", ArrayType(IntegerType)),
+    Property("language", StringType),
+    Property("background", StringType),
+    Property("isNumberColumnEnabled", BooleanType),
+    Property("localId", StringType),
+    Property("color", StringType),
+    Property("panelType", StringType),
+    Property("level", IntegerType),
+    Property("accessLevel", StringType),
+    Property("style", StringType),
+    Property("order", IntegerType),
+    Property("text", StringType),
+    Property("shortName", StringType),
+    Property("url", StringType),
+    Property("layout", StringType),
+    Property("id", StringType),
+    Property("type", StringType),
+    Property("collection", StringType),
+    Property("width", NumberType),
+    Property("height", NumberType),
+    Property("occurrenceKey", StringType),
+)
+
+_USER = ObjectType(
+    Property("self", StringType),
+    Property("accountId", StringType),
+    Property("emailAddress", StringType),
+    Property("avatarUrls", _AVATAR_URLS),
+    Property("displayName", StringType),
+    Property("active", BooleanType),
+    Property("timeZone", StringType),
+    Property("accountType", StringType),
+)
+
+_AUTHOR = ObjectType(
+    Property("accountId", StringType),
+    Property("self", StringType),
+    Property("displayName", StringType),
+    Property("active", BooleanType),
+)
+
+_ADF_MARKS = ArrayType(
+    ObjectType(
+        Property("type", StringType),
+        Property("attrs", _ADF_ATTRS),
+    ),
+)
+
+_PERMISSION = ObjectType(
+    Property("key", StringType),
+    Property("name", StringType),
+    Property("type", StringType),
+    Property("description", StringType),
+)
+
+_BASE_ITEM_SCHEMA = ObjectType(
+    Property("id", StringType),
+    Property("self", StringType),
+    Property("value", StringType),
+)
+
+
+@functools.cache
+def _content_schema() -> ArrayType:
+    """
+    Builds the ADF content node schema, shared by reference and built once
+    """
+    return ArrayType(
+        ObjectType(
+            Property("version", IntegerType),
+            Property("text", StringType),
+            Property("type", StringType),
+            Property("attrs", _ADF_ATTRS),
+            Property("marks", _ADF_MARKS),
+        )
+    )
+
+
+@functools.cache
+def _base_content_schema() -> ObjectType:
+    """
+    Builds the ADF document schema used by rich-text custom fields
+    """
+    return ObjectType(
         Property(
-            "insight",
-            ObjectType(
-                Property("totalIssueCount", IntegerType),
-                Property("lastIssueUpdateTime", StringType),
+            "content",
+            ArrayType(
+                ObjectType(
+                    Property("version", IntegerType),
+                    Property("text", StringType),
+                    Property("type", StringType),
+                    Property("content", _content_schema()),
+                    Property("attrs", _ADF_ATTRS),
+                    Property("marks", _ADF_MARKS),
+                )
             ),
         ),
-    ).to_dict()
+        Property("type", StringType),
+        Property("version", IntegerType),
+    )
 
 
-class IssueStream(JiraStream):
+def _slim_adf_attrs(schema: dict) -> dict:
+    """
+    Returns a copy of ``schema`` with the ADF attrs objects left untyped;
+    applied when ``adf_full_schema`` is disabled to shrink SCHEMA output
+    """
+    full_attrs = Property("attrs", _ADF_ATTRS).to_dict()["attrs"]
+    slim_attrs = {"type": ["object", "null"], "additionalProperties": True}
+
+    def prune(node):
+        if isinstance(node, dict):
+            return {
+                key: dict(slim_attrs) if value == full_attrs else prune(value)
+                for key, value in node.items()
+            }
+        if isinstance(node, list):
+            return [prune(item) for item in node]
+        return node
+
+    return prune(schema)
+
+
+@functools.cache
+def _description_schema() -> ObjectType:
+    """
+    Builds the issue description ADF document schema; the self-similar
+    content nesting is assembled in a loop instead of unrolled by hand
+    """
+    content = ArrayType(_base_content_schema())
+    for _ in range(2):
+        content = ArrayType(
+            ObjectType(
+                Property("version", IntegerType),
+                Property("text", StringType),
+                Property("type", StringType),
+                Property("attrs", _ADF_ATTRS),
+                Property("marks", _ADF_MARKS),
+                Property("content", content),
+            )
+        )
+    return ObjectType(
+        Property("version", IntegerType),
+        Property("text", StringType),
+        Property("type", StringType),
+        Property("content", content),
+    )
+
 
+# Simple custom fields of the issues stream, spread into the fields object
+# in IssueStream._build_schema; object-shaped custom fields with bespoke
+# structure stay declared inline there.
+_ISSUE_CUSTOM_FIELDS = (
+    ("customfield_10030", ArrayType(StringType)),
+    ("customfield_10031", ArrayType(StringType)),
+    ("customfield_10032", StringType),
+    ("customfield_10033", StringType),
+    ("customfield_10034", StringType),
+    ("customfield_10035", StringType),
+    ("customfield_10036", StringType),
+    ("customfield_10037", StringType),
+    ("customfield_10022", StringType),
+    ("customfield_10023", StringType),
+    ("customfield_10024", StringType),
+    ("customfield_10025", StringType),
+    ("customfield_10016", NumberType),
+    ("customfield_10017", StringType),
+    ("customfield_10019", StringType),
+    ("customfield_10010", ArrayType(_BASE_ITEM_SCHEMA)),
+    ("customfield_10014", StringType),
+    ("customfield_10015", StringType),
+    ("customfield_10006", StringType),
+    ("customfield_10007", StringType),
+    ("customfield_10008", _BASE_ITEM_SCHEMA),
+    ("customfield_10009", StringType),
+    ("customfield_10041", StringType),
+    ("customfield_10043", StringType),
+    ("customfield_10044", StringType),
+    ("customfield_10045", StringType),
+    ("customfield_10001", ArrayType(StringType)),
+    ("customfield_10002", NumberType),
+    ("customfield_10003", NumberType),
+    ("customfield_10004", StringType),
+    ("customfield_10038", StringType),
+    ("customfield_10039", StringType),
+    ("customfield_10000", ArrayType(_BASE_ITEM_SCHEMA)),
+    ("customfield_10042", StringType),
+    ("customfield_10046", StringType),
+    ("customfield_10047", StringType),
+    ("customfield_11394", StringType),
+    ("customfield_11395", StringType),
+    ("customfield_11397", StringType),
+    ("customfield_11396", _BASE_ITEM_SCHEMA),
+    ("customfield_11399", StringType),
+    ("customfield_11398", DateType),
+    ("customfield_11384", _BASE_ITEM_SCHEMA),
+    ("customfield_11385", StringType),
+    ("customfield_10600", _BASE_ITEM_SCHEMA),
+    ("customfield_11490", _BASE_ITEM_SCHEMA),
+    ("customfield_11492", StringType),
+    ("customfield_11491", _BASE_ITEM_SCHEMA),
+    ("customfield_11377", StringType),
+    ("customfield_11497", NumberType),
+    ("customfield_11376", StringType),
+    ("customfield_11379", ArrayType(_BASE_ITEM_SCHEMA)),
+    ("customfield_11378", ArrayType(_BASE_ITEM_SCHEMA)),
+    ("customfield_11481", ArrayType(_BASE_ITEM_SCHEMA)),
+    ("customfield_11482", _BASE_ITEM_SCHEMA),
+    ("customfield_11485", StringType),
+    ("customfield_11000", StringType),
+    ("customfield_11487", StringType),
+    ("customfield_11486", StringType),
+    ("customfield_11489", _BASE_ITEM_SCHEMA),
+    ("customfield_11368", DateType),
+    ("customfield_11488", StringType),
+    ("customfield_11359", DateType),
+    ("customfield_11358", StringType),
+    ("customfield_10701", StringType),
+    ("customfield_11470", NumberType),
+    ("customfield_11591", _BASE_ITEM_SCHEMA),
+    ("customfield_11472", NumberType),
+    ("customfield_11350", _BASE_ITEM_SCHEMA),
+    ("customfield_11353", _BASE_ITEM_SCHEMA),
+    ("customfield_11594", StringType),
+    ("customfield_11473", StringType),
+    ("customfield_11355", _BASE_ITEM_SCHEMA),
+    ("customfield_11596", NumberType),
+    ("customfield_11354", _BASE_ITEM_SCHEMA),
+    ("customfield_11475", _BASE_ITEM_SCHEMA),
+    ("customfield_11357", StringType),
+    ("customfield_11356", StringType),
+    ("customfield_11598", StringType),
+    ("customfield_11469", _BASE_ITEM_SCHEMA),
+    ("customfield_11468", NumberType),
+    ("customfield_11347", StringType),
+    ("customfield_11582", _BASE_ITEM_SCHEMA),
+    ("customfield_11461", NumberType),
+    ("customfield_11340", StringType),
+    ("customfield_11460", StringType),
+    ("customfield_11463", NumberType),
+    ("customfield_11341", _BASE_ITEM_SCHEMA),
+    ("customfield_11583", _BASE_ITEM_SCHEMA),
+    ("customfield_11586", StringType),
+    ("customfield_11344", NumberType),
+    ("customfield_11465", DateType),
+    ("customfield_11585", StringType),
+    ("customfield_11464", NumberType),
+    ("customfield_11346", StringType),
+    ("customfield_11467", _BASE_ITEM_SCHEMA),
+    ("customfield_11466", NumberType),
+    ("customfield_11345", StringType),
+    ("customfield_11587", StringType),
+    ("customfield_11336", NumberType),
+    ("customfield_11457", _BASE_ITEM_SCHEMA),
+    ("customfield_11339", StringType),
+    ("customfield_11459", NumberType),
+    ("customfield_11338", _BASE_ITEM_SCHEMA),
+    ("customfield_11450", ArrayType(_BASE_ITEM_SCHEMA)),
+    ("customfield_11452", _BASE_ITEM_SCHEMA),
+    ("customfield_11451", StringType),
+    ("customfield_11454", _BASE_ITEM_SCHEMA),
+    ("customfield_11333", _BASE_ITEM_SCHEMA),
+    ("customfield_11575", _BASE_ITEM_SCHEMA),
+    ("customfield_11453", DateType),
+    ("customfield_11332", StringType),
+    ("customfield_11335", _base_content_schema()),
+    ("customfield_11576", StringType),
+    ("customfield_11342", _BASE_ITEM_SCHEMA),
+    ("customfield_11455", ArrayType(_BASE_ITEM_SCHEMA)),
+    ("customfield_11326", ArrayType(_BASE_ITEM_SCHEMA)),
+    ("customfield_11447", ArrayType(_BASE_ITEM_SCHEMA)),
+    ("customfield_11568", NumberType),
+    ("customfield_11567", NumberType),
+    ("customfield_11446", ArrayType(_BASE_ITEM_SCHEMA)),
+    ("customfield_11325", ArrayType(_BASE_ITEM_SCHEMA)),
+    ("customfield_11449", ArrayType(_BASE_ITEM_SCHEMA)),
+    ("customfield_11448", ArrayType(_BASE_ITEM_SCHEMA)),
+    ("customfield_11560", StringType),
+    ("customfield_11441", StringType),
+    ("customfield_11320", _BASE_ITEM_SCHEMA),
+    ("customfield_11561", _base_content_schema()),
+    ("customfield_11443", StringType),
+    ("customfield_11200", _BASE_ITEM_SCHEMA),
+    ("customfield_11321", _BASE_ITEM_SCHEMA),
+    ("customfield_11564", _base_content_schema()),
+    ("customfield_11322", _BASE_ITEM_SCHEMA),
+    ("customfield_11563", _base_content_schema()),
+    ("customfield_11323", StringType),
+    ("customfield_11566", NumberType),
+    ("customfield_11445", StringType),
+    ("customfield_11324", StringType),
+    ("customfield_11565", NumberType),
+    ("customfield_11444", StringType),
+    ("customfield_11557", StringType),
+    ("customfield_11314", _BASE_ITEM_SCHEMA),
+    ("customfield_11436", StringType),
+    ("customfield_11435", StringType),
+    ("customfield_11556", StringType),
+    ("customfield_11315", DateTimeType),
+    ("customfield_11559", _BASE_ITEM_SCHEMA),
+    ("customfield_11316", DateTimeType),
+    ("customfield_11438", StringType),
+    ("customfield_11437", StringType),
+    ("customfield_11558", _BASE_ITEM_SCHEMA),
+    ("customfield_11317", _BASE_ITEM_SCHEMA),
+    ("customfield_11318", _BASE_ITEM_SCHEMA),
+    ("customfield_11319", _BASE_ITEM_SCHEMA),
+    ("customfield_11439", StringType),
+    ("customfield_11430", _BASE_ITEM_SCHEMA),
+    ("customfield_11310", ArrayType(_BASE_ITEM_SCHEMA)),
+    ("customfield_10100", StringType),
+    ("customfield_11431", ArrayType(_BASE_ITEM_SCHEMA)),
+    ("customfield_11311", _BASE_ITEM_SCHEMA),
+    ("customfield_11434", NumberType),
+    ("customfield_11312", _BASE_ITEM_SCHEMA),
+    ("customfield_11555", _BASE_ITEM_SCHEMA),
+    ("customfield_11433", StringType),
+    ("customfield_11313", _BASE_ITEM_SCHEMA),
+    ("customfield_11425", NumberType),
+    ("customfield_11303", DateType),
+    ("customfield_11667", StringType),
+    ("customfield_11666", ArrayType(_BASE_ITEM_SCHEMA)),
+    ("customfield_11545", _base_content_schema()),
+    ("customfield_11424", NumberType),
+    ("customfield_11615", StringType),
+    ("customfield_11427", NumberType),
+    ("customfield_11548", _BASE_ITEM_SCHEMA),
+    ("customfield_11668", _BASE_ITEM_SCHEMA),
+    ("customfield_11306", ArrayType(_BASE_ITEM_SCHEMA)),
+    ("customfield_11307", NumberType),
+    ("customfield_11429", _BASE_ITEM_SCHEMA),
+    ("customfield_11308", _BASE_ITEM_SCHEMA),
+    ("customfield_11428", NumberType),
+    ("customfield_11549", StringType),
+    ("customfield_11309", DateTimeType),
+    ("customfield_11661", _BASE_ITEM_SCHEMA),
+    ("customfield_11660", _base_content_schema()),
+    ("customfield_11421", NumberType),
+    ("customfield_11663", NumberType),
+    ("customfield_11420", NumberType),
+    ("customfield_11300", StringType),
+    ("customfield_11665", StringType),
+    ("customfield_11301", DateType),
+    ("customfield_11423", NumberType),
+    ("customfield_11302", _BASE_ITEM_SCHEMA),
+    ("customfield_11422", NumberType),
+    ("customfield_11664", StringType),
+    ("customfield_11414", DateTimeType),
+    ("customfield_11656", StringType),
+    ("customfield_11413", _BASE_ITEM_SCHEMA),
+    ("customfield_11658", StringType),
+    ("customfield_11415", DateType),
+    ("customfield_11657", _BASE_ITEM_SCHEMA),
+    ("customfield_11418", DateType),
+    ("customfield_11659", StringType),
+    ("customfield_11652", _BASE_ITEM_SCHEMA),
+    ("customfield_11410", StringType),
+    ("customfield_11530", _base_content_schema()),
+    ("customfield_11411", StringType),
+    ("customfield_11524", _BASE_ITEM_SCHEMA),
+    ("customfield_11403", DateType),
+    ("customfield_11645", NumberType),
+    ("customfield_11402", ArrayType(_BASE_ITEM_SCHEMA)),
+    ("customfield_11644", NumberType),
+    ("customfield_11523", DateType),
+    ("customfield_11647", StringType),
+    ("customfield_11405", StringType),
+    ("customfield_11526", StringType),
+    ("customfield_11404", StringType),
+    ("customfield_11525", StringType),
+    ("customfield_11528", _base_content_schema()),
+    ("customfield_11649", StringType),
+    ("customfield_11648", ArrayType(_BASE_ITEM_SCHEMA)),
+    ("customfield_11527", StringType),
+    ("customfield_11529", StringType),
+    ("customfield_11641", StringType),
+    ("customfield_11520", _BASE_ITEM_SCHEMA),
+    ("customfield_11640", StringType),
+    ("customfield_11643", NumberType),
+    ("customfield_11522", DateType),
+    ("customfield_11401", StringType),
+    ("customfield_11400", StringType),
+    ("customfield_11642", NumberType),
+    ("customfield_11521", _BASE_ITEM_SCHEMA),
+    ("customfield_11513", DateType),
+    ("customfield_10302", DateTimeType),
+    ("customfield_11512", ArrayType(_BASE_ITEM_SCHEMA)),
+    ("customfield_11515", ArrayType(_BASE_ITEM_SCHEMA)),
+    ("customfield_11514", DateType),
+    ("customfield_11638", _BASE_ITEM_SCHEMA),
+    ("customfield_11517", ArrayType(StringType)),
+    ("customfield_11516", _BASE_ITEM_SCHEMA),
+    ("customfield_11637", _BASE_ITEM_SCHEMA),
+    ("customfield_11519", _BASE_ITEM_SCHEMA),
+    ("customfield_11639", _BASE_ITEM_SCHEMA),
+    ("customfield_11518", StringType),
+    ("customfield_10300", StringType),
+    ("customfield_11511", StringType),
+    ("customfield_10301", StringType),
+    ("customfield_11510", _BASE_ITEM_SCHEMA),
+    ("customfield_11502", NumberType),
+    ("customfield_11501", StringType),
+    ("customfield_11503", _BASE_ITEM_SCHEMA),
+    ("customfield_11505", _BASE_ITEM_SCHEMA),
+    ("customfield_11508", DateType),
+    ("customfield_11507", _BASE_ITEM_SCHEMA),
+    ("customfield_11509", StringType),
+    ("customfield_11618", _BASE_ITEM_SCHEMA),
+    ("customfield_11610", NumberType),
+    ("customfield_11600", _BASE_ITEM_SCHEMA),
+    ("customfield_11380", StringType),
+    ("customfield_11382", StringType),
+    ("customfield_11381", StringType),
+    ("customfield_11480", _BASE_ITEM_SCHEMA),
+    ("customfield_11479", StringType),
+    ("customfield_11590", NumberType),
+    ("customfield_11478", StringType),
+    ("customfield_11477", StringType),
+    ("customfield_11348", NumberType),
+    ("customfield_11349", _BASE_ITEM_SCHEMA),
+    ("customfield_11343", _BASE_ITEM_SCHEMA),
+    ("customfield_11571", _BASE_ITEM_SCHEMA),
+    ("customfield_11573", _BASE_ITEM_SCHEMA),
+    ("customfield_11572", NumberType),
+    ("customfield_11574", _BASE_ITEM_SCHEMA),
+    ("customfield_11577", _BASE_ITEM_SCHEMA),
+    ("customfield_11569", StringType),
+    ("customfield_11551", NumberType),
+    ("customfield_11550", StringType),
+    ("customfield_11553", NumberType),
+    ("customfield_11552", StringType),
+    ("customfield_11554", NumberType),
+    ("customfield_11540", _BASE_ITEM_SCHEMA),
+    ("customfield_11541", _BASE_ITEM_SCHEMA),
+    ("customfield_11543", StringType),
+    ("customfield_11617", StringType),
+    ("customfield_11504", _BASE_ITEM_SCHEMA),
+    ("customfield_11616", NumberType),
+)
+
+
+class IssueStream(JiraStream):
     """
     https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-issue-search/#api-rest-api-3-search-get
     """
@@ -385,2420 +862,720 @@ class IssueStream(JiraStream):
     """
 
     name = "issues"
-    path = "/search"
+    path = "/search/jql"
     primary_keys = ["id"]
     replication_key = "id"
     replication_method = "INCREMENTAL"
     records_jsonpath = "$[issues][*]"  # Or override `parse_response`.
     instance_name = "issues"
 
-    __content_schema = __content_schema = ArrayType(
-        ObjectType(
-            Property("version", IntegerType),
-            Property("text", StringType),
-            Property("type", StringType),
+    @functools.cached_property
+    def _adf_as_json_string(self) -> bool:
+        """
+        Whether issue descriptions are emitted as JSON strings, read from
+        config once rather than per record
+        """
+        return self.config.get("adf_mode", "nested") == "json_string"
+
+    @functools.cached_property
+    def _selected_fields(self) -> tuple[str, ...] | None:
+        """
+        Issue fields allow-listed via ``stream_options.issues.fields``, or
+        ``None`` when every field is synced
+        """
+        fields = (
+            (self.config.get("stream_options") or {}).get("issues", {}).get("fields")
+        )
+        if not fields:
+            return None
+        return tuple(fields)
+
+    @property
+    def schema(self) -> dict:
+        """
+        Returns the stream schema, with the ADF attrs objects slimmed to
+        untyped objects when ``adf_full_schema`` is disabled and the fields
+        object pruned to the configured allow-list
+        """
+        schema = getattr(self, "_schema", None)
+        if schema is None:
+            schema = self._schema_dict()
+            if not self.config.get("adf_full_schema", True):
+                schema = _slim_adf_attrs(schema)
+            if self._adf_as_json_string or self._selected_fields is not None:
+                schema = dict(schema)
+                schema["properties"] = dict(schema["properties"])
+                fields = dict(schema["properties"]["fields"])
+                fields["properties"] = dict(fields["properties"])
+                if self._adf_as_json_string:
+                    fields["properties"]["description"] = {"type": ["string", "null"]}
+                if self._selected_fields is not None:
+                    keep = set(self._selected_fields)
+                    fields["properties"] = {
+                        key: value
+                        for key, value in fields["properties"].items()
+                        if key in keep
+                    }
+                schema["properties"]["fields"] = fields
+            self._schema = schema
+        return schema
+
+    @classmethod
+    def _build_schema(cls) -> dict:
+        return PropertiesList(
+            Property("expand", StringType),
+            Property("id", StringType),
+            Property("self", StringType),
+            Property("key", StringType),
             Property(
-                "attrs",
+                "fields",
                 ObjectType(
-                    Property("href", StringType),
-                    Property("colspan", IntegerType),
-                    Property("alt", StringType),
-                    Property("timestamp", StringType),
-                    Property(
-                        "colwidth",
-                        ArrayType(IntegerType),
+                    *(
+                        Property(name, field_type)
+                        for name, field_type in _ISSUE_CUSTOM_FIELDS
                     ),
-                    Property("language", StringType),
-                    Property("background", StringType),
+                    Property("statuscategorychangedate", StringType),
+                    Property("issuetype", _ISSUETYPE),
                     Property(
-                        "isNumberColumnEnabled",
-                        BooleanType,
-                    ),
-                    Property("localId", StringType),
-                    Property("color", StringType),
-                    Property("panelType", StringType),
-                    Property("level", IntegerType),
-                    Property("accessLevel", StringType),
-                    Property("style", StringType),
-                    Property("order", IntegerType),
-                    Property("text", StringType),
-                    Property("shortName", StringType),
-                    Property("url", StringType),
-                    Property("layout", StringType),
-                    Property("id", StringType),
-                    Property("type", StringType),
-                    Property("collection", StringType),
-                    Property("width", NumberType),
-                    Property("height", NumberType),
-                    Property("occurrenceKey", StringType),
-                ),
-            ),
-            Property(
-                "marks",
-                ArrayType(
-                    ObjectType(
-                        Property("type", StringType),
-                        Property(
-                            "attrs",
-                            ObjectType(
-                                Property(
-                                    "href",
-                                    StringType,
-                                ),
-                                Property(
-                                    "colspan",
-                                    IntegerType,
-                                ),
-                                Property(
-                                    "alt",
-                                    StringType,
-                                ),
-                                Property(
-                                    "timestamp",
-                                    StringType,
-                                ),
-                                Property(
-                                    "colwidth",
-                                    ArrayType(IntegerType),
-                                ),
-                                Property(
-                                    "language",
-                                    StringType,
-                                ),
-                                Property(
-                                    "background",
-                                    StringType,
-                                ),
-                                Property(
-                                    "isNumberColumnEnabled",
-                                    BooleanType,
-                                ),
-                                Property(
-                                    "localId",
-                                    StringType,
-                                ),
-                                Property(
-                                    "color",
-                                    StringType,
-                                ),
-                                Property(
-                                    "panelType",
-                                    StringType,
-                                ),
-                                Property(
-                                    "level",
-                                    IntegerType,
-                                ),
-                                Property(
-                                    "accessLevel",
-                                    StringType,
-                                ),
-                                Property(
-                                    "style",
-                                    StringType,
-                                ),
-                                Property(
-                                    "order",
-                                    IntegerType,
-                                ),
-                                Property(
-                                    "text",
-                                    StringType,
-                                ),
-                                Property(
-                                    "shortName",
-                                    StringType,
-                                ),
-                                Property(
-                                    "url",
-                                    StringType,
-                                ),
-                                Property(
-                                    "layout",
-                                    StringType,
-                                ),
-                                Property("id", StringType),
-                                Property(
-                                    "type",
-                                    StringType,
-                                ),
-                                Property(
-                                    "collection",
-                                    StringType,
-                                ),
-                                Property(
-                                    "width",
-                                    NumberType,
-                                ),
-                                Property(
-                                    "height",
-                                    NumberType,
-                                ),
-                                Property(
-                                    "occurrenceKey",
-                                    StringType,
+                        "parent",
+                        ObjectType(
+                            Property("id", StringType),
+                            Property("key", StringType),
+                            Property("self", StringType),
+                            Property(
+                                "fields",
+                                ObjectType(
+                                    Property("summary", StringType),
+                                    Property("status", _STATUS),
+                                    Property("priority", _PRIORITY),
+                                    Property("issuetype", _ISSUETYPE),
                                 ),
                             ),
                         ),
                     ),
-                ),
-            ),
-        )
-    )
-
-    base_content_schema = ObjectType(
-        Property(
-            "content",
-            ArrayType(
-                ObjectType(
-                    Property("version", IntegerType),
-                    Property("text", StringType),
-                    Property("type", StringType),
-                    Property("content", __content_schema),
+                    Property("timespent", IntegerType),
                     Property(
-                        "attrs",
+                        "project",
                         ObjectType(
-                            Property("href", StringType),
-                            Property("colspan", IntegerType),
-                            Property("alt", StringType),
-                            Property("timestamp", StringType),
-                            Property(
-                                "colwidth",
-                                ArrayType(IntegerType),
-                            ),
-                            Property("language", StringType),
-                            Property("background", StringType),
-                            Property(
-                                "isNumberColumnEnabled",
-                                BooleanType,
-                            ),
-                            Property("localId", StringType),
-                            Property("color", StringType),
-                            Property("panelType", StringType),
-                            Property("level", IntegerType),
-                            Property("accessLevel", StringType),
-                            Property("style", StringType),
-                            Property("order", IntegerType),
-                            Property("text", StringType),
-                            Property("shortName", StringType),
-                            Property("url", StringType),
-                            Property("layout", StringType),
+                            Property("self", StringType),
                             Property("id", StringType),
-                            Property("type", StringType),
-                            Property("collection", StringType),
-                            Property("width", NumberType),
-                            Property("height", NumberType),
-                            Property("occurrenceKey", StringType),
+                            Property("key", StringType),
+                            Property("name", StringType),
+                            Property("projectTypeKey", StringType),
+                            Property("simplified", BooleanType),
+                            Property("avatarUrls", _AVATAR_URLS),
                         ),
                     ),
                     Property(
-                        "marks",
+                        "fixVersions",
                         ArrayType(
                             ObjectType(
-                                Property("type", StringType),
-                                Property(
-                                    "attrs",
-                                    ObjectType(
-                                        Property(
-                                            "href",
-                                            StringType,
-                                        ),
-                                        Property(
-                                            "colspan",
-                                            IntegerType,
-                                        ),
-                                        Property(
-                                            "alt",
-                                            StringType,
-                                        ),
-                                        Property(
-                                            "timestamp",
-                                            StringType,
-                                        ),
-                                        Property(
-                                            "colwidth",
-                                            ArrayType(IntegerType),
-                                        ),
-                                        Property(
-                                            "language",
-                                            StringType,
-                                        ),
-                                        Property(
-                                            "background",
-                                            StringType,
-                                        ),
-                                        Property(
-                                            "isNumberColumnEnabled",
-                                            BooleanType,
-                                        ),
-                                        Property(
-                                            "localId",
-                                            StringType,
-                                        ),
-                                        Property(
-                                            "color",
-                                            StringType,
-                                        ),
-                                        Property(
-                                            "panelType",
-                                            StringType,
-                                        ),
-                                        Property(
-                                            "level",
-                                            IntegerType,
-                                        ),
-                                        Property(
-                                            "accessLevel",
-                                            StringType,
-                                        ),
-                                        Property(
-                                            "style",
-                                            StringType,
-                                        ),
-                                        Property(
-                                            "order",
-                                            IntegerType,
-                                        ),
-                                        Property(
-                                            "text",
-                                            StringType,
-                                        ),
-                                        Property(
-                                            "shortName",
-                                            StringType,
-                                        ),
-                                        Property(
-                                            "url",
-                                            StringType,
-                                        ),
-                                        Property(
-                                            "layout",
-                                            StringType,
-                                        ),
-                                        Property("id", StringType),
-                                        Property(
-                                            "type",
-                                            StringType,
-                                        ),
-                                        Property(
-                                            "collection",
-                                            StringType,
-                                        ),
-                                        Property(
-                                            "width",
-                                            NumberType,
-                                        ),
-                                        Property(
-                                            "height",
-                                            NumberType,
-                                        ),
-                                        Property(
-                                            "occurrenceKey",
-                                            StringType,
-                                        ),
-                                    ),
-                                ),
+                                Property("id", StringType),
+                                Property("archived", BooleanType),
+                                Property("name", StringType),
+                                Property("released", BooleanType),
+                                Property("self", StringType),
+                            )
+                        ),
+                    ),
+                    Property("aggregatetimespent", IntegerType),
+                    Property(
+                        "resolution",
+                        ObjectType(
+                            Property("description", StringType),
+                            Property("id", StringType),
+                            Property("name", StringType),
+                            Property("self", StringType),
+                        ),
+                    ),
+                    Property("resolutiondate", StringType),
+                    Property("workratio", IntegerType),
+                    Property(
+                        "watches",
+                        ObjectType(
+                            Property("self", StringType),
+                            Property("watchCount", IntegerType),
+                            Property("isWatching", BooleanType),
+                        ),
+                    ),
+                    Property("issuerestriction", StringType),
+                    Property("lastViewed", StringType),
+                    Property("created", StringType),
+                    Property(
+                        "customfield_10020",
+                        ArrayType(
+                            ObjectType(
+                                Property("boardId", IntegerType),
+                                Property("completeDate", StringType),
+                                Property("endDate", StringType),
+                                Property("goal", StringType),
+                                Property("id", IntegerType),
+                                Property("name", StringType),
+                                Property("startDate", StringType),
+                                Property("state", StringType),
                             ),
                         ),
                     ),
-                )
-            ),
-        ),
-        Property("type", StringType),
-        Property("version", IntegerType),
-    )
-    base_item_schema = ObjectType(
-        Property("id", StringType),
-        Property("self", StringType),
-        Property("value", StringType),
-    )
-
-    schema = PropertiesList(
-        Property("expand", StringType),
-        Property("id", StringType),
-        Property("self", StringType),
-        Property("key", StringType),
-        Property(
-            "fields",
-            ObjectType(
-                Property("statuscategorychangedate", StringType),
-                Property(
-                    "issuetype",
-                    ObjectType(
-                        Property("self", StringType),
-                        Property("id", StringType),
-                        Property("description", StringType),
-                        Property("iconUrl", StringType),
-                        Property("name", StringType),
-                        Property("subtask", BooleanType),
-                        Property("avatarId", IntegerType),
-                        Property("entityId", StringType),
-                        Property("hierarchyLevel", IntegerType),
+                    Property(
+                        "customfield_10021",
+                        ArrayType(
+                            ObjectType(
+                                Property("id", StringType),
+                                Property("self", StringType),
+                                Property("value", StringType),
+                            ),
+                        ),
                     ),
-                ),
-                Property(
-                    "parent",
-                    ObjectType(
-                        Property("id", StringType),
-                        Property("key", StringType),
-                        Property("self", StringType),
-                        Property(
-                            "fields",
+                    Property("priority", _PRIORITY),
+                    Property("labels", ArrayType(StringType)),
+                    Property(
+                        "customfield_10018",
+                        ObjectType(
+                            Property("hasEpicLinkFieldDependency", BooleanType),
+                            Property("showField", BooleanType),
+                            Property(
+                                "nonEditableReason",
+                                ObjectType(
+                                    Property("reason", StringType),
+                                    Property("message", StringType),
+                                ),
+                            ),
+                        ),
+                    ),
+                    Property("timeestimate", IntegerType),
+                    Property("aggregatetimeoriginalestimate", IntegerType),
+                    Property("versions", ArrayType(StringType)),
+                    Property(
+                        "issuelinks",
+                        ArrayType(
                             ObjectType(
-                                Property("summary", StringType),
+                                Property("id", StringType),
                                 Property(
-                                    "status",
+                                    "outwardIssue",
                                     ObjectType(
-                                        Property("description", StringType),
-                                        Property("iconUrl", StringType),
-                                        Property("id", StringType),
-                                        Property("name", StringType),
-                                        Property("self", StringType),
                                         Property(
-                                            "statusCategory",
+                                            "fields",
                                             ObjectType(
-                                                Property("colorName", StringType),
-                                                Property("id", IntegerType),
-                                                Property("key", StringType),
-                                                Property("name", StringType),
-                                                Property("self", StringType),
+                                                Property("issuetype", _ISSUETYPE),
+                                                Property("priority", _PRIORITY),
+                                                Property("status", _STATUS),
+                                                Property("summary", StringType),
                                             ),
                                         ),
+                                        Property("id", StringType),
+                                        Property("key", StringType),
+                                        Property("self", StringType),
                                     ),
                                 ),
                                 Property(
-                                    "priority",
+                                    "inwardIssue",
                                     ObjectType(
-                                        Property("self", StringType),
-                                        Property("iconUrl", StringType),
-                                        Property("name", StringType),
+                                        Property(
+                                            "fields",
+                                            ObjectType(
+                                                Property("issuetype", _ISSUETYPE),
+                                                Property("priority", _PRIORITY),
+                                                Property("status", _STATUS),
+                                                Property("summary", StringType),
+                                            ),
+                                        ),
                                         Property("id", StringType),
+                                        Property("key", StringType),
+                                        Property("self", StringType),
                                     ),
                                 ),
+                                Property("self", StringType),
                                 Property(
-                                    "issuetype",
+                                    "type",
                                     ObjectType(
-                                        Property("self", StringType),
                                         Property("id", StringType),
-                                        Property("description", StringType),
-                                        Property("iconUrl", StringType),
+                                        Property("inward", StringType),
                                         Property("name", StringType),
-                                        Property("subtask", BooleanType),
-                                        Property("avatarId", IntegerType),
-                                        Property("entityId", StringType),
-                                        Property("hierarchyLevel", IntegerType),
+                                        Property("outward", StringType),
+                                        Property("self", StringType),
                                     ),
                                 ),
                             ),
                         ),
                     ),
-                ),
-                Property("timespent", IntegerType),
-                Property("customfield_10030", ArrayType(StringType)),
-                Property("customfield_10031", ArrayType(StringType)),
-                Property(
-                    "project",
-                    ObjectType(
-                        Property("self", StringType),
-                        Property("id", StringType),
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("projectTypeKey", StringType),
-                        Property("simplified", BooleanType),
-                        Property(
-                            "avatarUrls",
+                    Property("assignee", _USER),
+                    Property("updated", StringType),
+                    Property("status", _STATUS),
+                    Property(
+                        "components",
+                        ArrayType(
                             ObjectType(
-                                Property("48x48", StringType),
-                                Property("24x24", StringType),
-                                Property("16x16", StringType),
-                                Property("32x32", StringType),
-                            ),
-                        ),
-                    ),
-                ),
-                Property("customfield_10032", StringType),
-                Property(
-                    "fixVersions",
-                    ArrayType(
-                        ObjectType(
-                            Property("id", StringType),
-                            Property("archived", BooleanType),
-                            Property("name", StringType),
-                            Property("released", BooleanType),
-                            Property("self", StringType),
-                        )
-                    ),
-                ),
-                Property("customfield_10033", StringType),
-                Property("customfield_10034", StringType),
-                Property("aggregatetimespent", IntegerType),
-                Property("customfield_10035", StringType),
-                Property(
-                    "resolution",
-                    ObjectType(
-                        Property("description", StringType),
-                        Property("id", StringType),
-                        Property("name", StringType),
-                        Property("self", StringType),
-                    ),
-                ),
-                Property("customfield_10036", StringType),
-                Property("customfield_10037", StringType),
-                Property("resolutiondate", StringType),
-                Property("workratio", IntegerType),
-                Property(
-                    "watches",
-                    ObjectType(
-                        Property("self", StringType),
-                        Property("watchCount", IntegerType),
-                        Property("isWatching", BooleanType),
-                    ),
-                ),
-                Property("issuerestriction", StringType),
-                Property("lastViewed", StringType),
-                Property("created", StringType),
-                Property(
-                    "customfield_10020",
-                    ArrayType(
-                        ObjectType(
-                            Property("boardId", IntegerType),
-                            Property("completeDate", StringType),
-                            Property("endDate", StringType),
-                            Property("goal", StringType),
-                            Property("id", IntegerType),
-                            Property("name", StringType),
-                            Property("startDate", StringType),
-                            Property("state", StringType),
+                                Property("self", StringType),
+                                Property("id", StringType),
+                                Property("name", StringType),
+                            )
                         ),
                     ),
-                ),
-                Property(
-                    "customfield_10021",
-                    ArrayType(
-                        ObjectType(
-                            Property("id", StringType),
-                            Property("self", StringType),
-                            Property("value", StringType),
+                    Property("timeoriginalestimate", IntegerType),
+                    Property("description", _description_schema()),
+                    Property("timetracking", StringType),
+                    Property(
+                        "customfield_10005",
+                        ArrayType(
+                            ObjectType(
+                                Property("id", IntegerType),
+                                Property("boardId", IntegerType),
+                                Property("name", StringType),
+                                Property("state", StringType),
+                                Property("goal", DateTimeType),
+                                Property("startDate", DateTimeType),
+                                Property("completeDate", DateTimeType),
+                            )
                         ),
                     ),
-                ),
-                Property("customfield_10022", StringType),
-                Property("customfield_10023", StringType),
-                Property(
-                    "priority",
-                    ObjectType(
-                        Property("self", StringType),
-                        Property("iconUrl", StringType),
-                        Property("name", StringType),
-                        Property("id", StringType),
-                    ),
-                ),
-                Property("customfield_10024", StringType),
-                Property("customfield_10025", StringType),
-                Property("labels", ArrayType(StringType)),
-                Property("customfield_10016", NumberType),
-                Property("customfield_10017", StringType),
-                Property(
-                    "customfield_10018",
-                    ObjectType(
-                        Property("hasEpicLinkFieldDependency", BooleanType),
-                        Property("showField", BooleanType),
-                        Property(
-                            "nonEditableReason",
+                    Property("security", StringType),
+                    Property("aggregatetimeestimate", IntegerType),
+                    Property("attachment", ArrayType(StringType)),
+                    Property("summary", StringType),
+                    Property("creator", _USER),
+                    Property(
+                        "subtasks",
+                        ArrayType(
                             ObjectType(
-                                Property("reason", StringType),
-                                Property("message", StringType),
+                                Property("id", StringType),
+                                Property("key", StringType),
+                                Property("self", StringType),
+                                Property(
+                                    "fields",
+                                    ObjectType(
+                                        Property("summary", StringType),
+                                        Property("status", _STATUS),
+                                        Property("priority", _PRIORITY),
+                                        Property("issuetype", _ISSUETYPE),
+                                    ),
+                                ),
                             ),
                         ),
                     ),
-                ),
-                Property("customfield_10019", StringType),
-                Property("timeestimate", IntegerType),
-                Property("aggregatetimeoriginalestimate", IntegerType),
-                Property("versions", ArrayType(StringType)),
-                Property(
-                    "issuelinks",
-                    ArrayType(
+                    Property("reporter", _USER),
+                    Property(
+                        "aggregateprogress",
                         ObjectType(
-                            Property("id", StringType),
-                            Property(
-                                "outwardIssue",
-                                ObjectType(
-                                    Property(
-                                        "fields",
-                                        ObjectType(
-                                            Property(
-                                                "issuetype",
-                                                ObjectType(
-                                                    Property("avatarId", IntegerType),
-                                                    Property("description", StringType),
-                                                    Property("entityId", StringType),
-                                                    Property(
-                                                        "hierarchyLevel", IntegerType
-                                                    ),
-                                                    Property("iconUrl", StringType),
-                                                    Property("id", StringType),
-                                                    Property("name", StringType),
-                                                    Property("self", StringType),
-                                                    Property("subtask", BooleanType),
-                                                ),
-                                            ),
-                                            Property(
-                                                "priority",
-                                                ObjectType(
-                                                    Property("iconUrl", StringType),
-                                                    Property("id", StringType),
-                                                    Property("name", StringType),
-                                                    Property("self", StringType),
-                                                ),
-                                            ),
-                                            Property(
-                                                "status",
-                                                ObjectType(
-                                                    Property("description", StringType),
-                                                    Property("iconUrl", StringType),
-                                                    Property("id", StringType),
-                                                    Property("name", StringType),
-                                                    Property("self", StringType),
-                                                    Property(
-                                                        "statusCategory",
-                                                        ObjectType(
-                                                            Property(
-                                                                "colorName", StringType
-                                                            ),
-                                                            Property("id", IntegerType),
-                                                            Property("key", StringType),
-                                                            Property(
-                                                                "name", StringType
-                                                            ),
-                                                            Property(
-                                                                "self", StringType
-                                                            ),
-                                                        ),
-                                                    ),
-                                                ),
-                                            ),
-                                            Property("summary", StringType),
-                                        ),
-                                    ),
-                                    Property("id", StringType),
-                                    Property("key", StringType),
-                                    Property("self", StringType),
-                                ),
-                            ),
+                            Property("progress", IntegerType),
+                            Property("total", IntegerType),
+                            Property("percent", IntegerType),
+                        ),
+                    ),
+                    Property(
+                        "environment",
+                        ObjectType(
+                            Property("type", StringType),
                             Property(
-                                "inwardIssue",
-                                ObjectType(
-                                    Property(
-                                        "fields",
-                                        ObjectType(
-                                            Property(
-                                                "issuetype",
-                                                ObjectType(
-                                                    Property("avatarId", IntegerType),
-                                                    Property("description", StringType),
-                                                    Property("entityId", StringType),
-                                                    Property(
-                                                        "hierarchyLevel", IntegerType
-                                                    ),
-                                                    Property("iconUrl", StringType),
-                                                    Property("id", StringType),
-                                                    Property("name", StringType),
-                                                    Property("self", StringType),
-                                                    Property("subtask", BooleanType),
-                                                ),
-                                            ),
-                                            Property(
-                                                "priority",
-                                                ObjectType(
-                                                    Property("iconUrl", StringType),
-                                                    Property("id", StringType),
-                                                    Property("name", StringType),
-                                                    Property("self", StringType),
-                                                ),
-                                            ),
-                                            Property(
-                                                "status",
+                                "content",
+                                ArrayType(
+                                    ObjectType(
+                                        Property(
+                                            "content",
+                                            ArrayType(
                                                 ObjectType(
-                                                    Property("description", StringType),
-                                                    Property("iconUrl", StringType),
-                                                    Property("id", StringType),
-                                                    Property("name", StringType),
-                                                    Property("self", StringType),
-                                                    Property(
-                                                        "statusCategory",
-                                                        ObjectType(
-                                                            Property(
-                                                                "colorName", StringType
-                                                            ),
-                                                            Property("id", IntegerType),
-                                                            Property("key", StringType),
-                                                            Property(
-                                                                "name", StringType
-                                                            ),
-                                                            Property(
-                                                                "self", StringType
-                                                            ),
-                                                        ),
-                                                    ),
+                                                    Property("text", StringType),
+                                                    Property("type", StringType),
                                                 ),
                                             ),
-                                            Property("summary", StringType),
                                         ),
+                                        Property("type", StringType),
                                     ),
-                                    Property("id", StringType),
-                                    Property("key", StringType),
-                                    Property("self", StringType),
-                                ),
-                            ),
-                            Property("self", StringType),
-                            Property(
-                                "type",
-                                ObjectType(
-                                    Property("id", StringType),
-                                    Property("inward", StringType),
-                                    Property("name", StringType),
-                                    Property("outward", StringType),
-                                    Property("self", StringType),
                                 ),
                             ),
+                            Property("text", StringType),
+                            Property("version", IntegerType),
                         ),
                     ),
-                ),
-                Property(
-                    "assignee",
-                    ObjectType(
-                        Property("self", StringType),
-                        Property("accountId", StringType),
-                        Property(
-                            "avatarUrls",
-                            ObjectType(
-                                Property("48x48", StringType),
-                                Property("24x24", StringType),
-                                Property("16x16", StringType),
-                                Property("32x32", StringType),
-                            ),
+                    Property("duedate", StringType),
+                    Property(
+                        "progress",
+                        ObjectType(
+                            Property("progress", IntegerType),
+                            Property("total", IntegerType),
                         ),
-                        Property("displayName", StringType),
-                        Property("active", BooleanType),
-                        Property("timeZone", StringType),
-                        Property("accountType", StringType),
-                        Property("emailAddress", StringType),
                     ),
-                ),
-                Property("updated", StringType),
-                Property(
-                    "status",
-                    ObjectType(
-                        Property("self", StringType),
-                        Property("description", StringType),
-                        Property("iconUrl", StringType),
-                        Property("name", StringType),
-                        Property("id", StringType),
-                        Property(
-                            "statusCategory",
-                            ObjectType(
-                                Property("self", StringType),
-                                Property("id", IntegerType),
-                                Property("key", StringType),
-                                Property("colorName", StringType),
-                                Property("name", StringType),
-                            ),
-                        ),
-                    ),
-                ),
-                Property(
-                    "components",
-                    ArrayType(
-                        ObjectType(
-                            Property("self", StringType),
-                            Property("id", StringType),
-                            Property("name", StringType),
-                        )
-                    ),
-                ),
-                Property("timeoriginalestimate", IntegerType),
-                Property(
-                    "description",
-                    ObjectType(
-                        Property("version", IntegerType),
-                        Property("text", StringType),
-                        Property("type", StringType),
-                        Property(
-                            "content",
-                            ArrayType(
-                                ObjectType(
-                                    Property("version", IntegerType),
-                                    Property("text", StringType),
-                                    Property("type", StringType),
-                                    Property(
-                                        "attrs",
-                                        ObjectType(
-                                            Property("href", StringType),
-                                            Property("language", StringType),
-                                            Property("timestamp", StringType),
-                                            Property("colspan", IntegerType),
-                                            Property("alt", StringType),
-                                            Property(
-                                                "colwidth", ArrayType(IntegerType)
-                                            ),
-                                            Property("background", StringType),
-                                            Property("color", StringType),
-                                            Property(
-                                                "isNumberColumnEnabled", BooleanType
-                                            ),
-                                            Property("localId", StringType),
-                                            Property("panelType", StringType),
-                                            Property("level", IntegerType),
-                                            Property("accessLevel", StringType),
-                                            Property("style", StringType),
-                                            Property("text", StringType),
-                                            Property("order", IntegerType),
-                                            Property("shortName", StringType),
-                                            Property("url", StringType),
-                                            Property("layout", StringType),
-                                            Property("id", StringType),
-                                            Property("type", StringType),
-                                            Property("collection", StringType),
-                                            Property("width", NumberType),
-                                            Property("height", NumberType),
-                                            Property("occurrenceKey", StringType),
-                                        ),
-                                    ),
-                                    Property(
-                                        "marks",
-                                        ArrayType(
-                                            ObjectType(
-                                                Property("type", StringType),
-                                                Property(
-                                                    "attrs",
-                                                    ObjectType(
-                                                        Property("href", StringType),
-                                                        Property(
-                                                            "colspan", IntegerType
-                                                        ),
-                                                        Property("alt", StringType),
-                                                        Property(
-                                                            "timestamp", StringType
-                                                        ),
-                                                        Property(
-                                                            "language", StringType
-                                                        ),
-                                                        Property(
-                                                            "colwidth",
-                                                            ArrayType(IntegerType),
-                                                        ),
-                                                        Property(
-                                                            "background", StringType
-                                                        ),
-                                                        Property(
-                                                            "isNumberColumnEnabled",
-                                                            BooleanType,
-                                                        ),
-                                                        Property("localId", StringType),
-                                                        Property("color", StringType),
-                                                        Property(
-                                                            "panelType", StringType
-                                                        ),
-                                                        Property("level", IntegerType),
-                                                        Property(
-                                                            "accessLevel", StringType
-                                                        ),
-                                                        Property("style", StringType),
-                                                        Property("order", IntegerType),
-                                                        Property("text", StringType),
-                                                        Property(
-                                                            "shortName", StringType
-                                                        ),
-                                                        Property("url", StringType),
-                                                        Property("layout", StringType),
-                                                        Property("id", StringType),
-                                                        Property("type", StringType),
-                                                        Property(
-                                                            "collection", StringType
-                                                        ),
-                                                        Property("width", NumberType),
-                                                        Property("height", NumberType),
-                                                        Property(
-                                                            "occurrenceKey", StringType
-                                                        ),
-                                                    ),
-                                                ),
-                                            ),
-                                        ),
-                                    ),
-                                    Property(
-                                        "content",
-                                        ArrayType(
-                                            ObjectType(
-                                                Property("version", IntegerType),
-                                                Property("text", StringType),
-                                                Property("type", StringType),
-                                                Property(
-                                                    "attrs",
-                                                    ObjectType(
-                                                        Property("href", StringType),
-                                                        Property(
-                                                            "colspan", IntegerType
-                                                        ),
-                                                        Property("alt", StringType),
-                                                        Property(
-                                                            "timestamp", StringType
-                                                        ),
-                                                        Property(
-                                                            "colwidth",
-                                                            ArrayType(IntegerType),
-                                                        ),
-                                                        Property(
-                                                            "language", StringType
-                                                        ),
-                                                        Property(
-                                                            "background", StringType
-                                                        ),
-                                                        Property(
-                                                            "isNumberColumnEnabled",
-                                                            BooleanType,
-                                                        ),
-                                                        Property("localId", StringType),
-                                                        Property("color", StringType),
-                                                        Property(
-                                                            "panelType", StringType
-                                                        ),
-                                                        Property("level", IntegerType),
-                                                        Property(
-                                                            "accessLevel", StringType
-                                                        ),
-                                                        Property("style", StringType),
-                                                        Property("order", IntegerType),
-                                                        Property("text", StringType),
-                                                        Property(
-                                                            "shortName", StringType
-                                                        ),
-                                                        Property("url", StringType),
-                                                        Property("layout", StringType),
-                                                        Property("id", StringType),
-                                                        Property("type", StringType),
-                                                        Property(
-                                                            "collection", StringType
-                                                        ),
-                                                        Property("width", NumberType),
-                                                        Property("height", NumberType),
-                                                        Property(
-                                                            "occurrenceKey", StringType
-                                                        ),
-                                                    ),
-                                                ),
-                                                Property(
-                                                    "marks",
-                                                    ArrayType(
-                                                        ObjectType(
-                                                            Property(
-                                                                "type", StringType
-                                                            ),
-                                                            Property(
-                                                                "attrs",
-                                                                ObjectType(
-                                                                    Property(
-                                                                        "href",
-                                                                        StringType,
-                                                                    ),
-                                                                    Property(
-                                                                        "colspan",
-                                                                        IntegerType,
-                                                                    ),
-                                                                    Property(
-                                                                        "alt",
-                                                                        StringType,
-                                                                    ),
-                                                                    Property(
-                                                                        "timestamp",
-                                                                        StringType,
-                                                                    ),
-                                                                    Property(
-                                                                        "colwidth",
-                                                                        ArrayType(
-                                                                            IntegerType
-                                                                        ),
-                                                                    ),
-                                                                    Property(
-                                                                        "language",
-                                                                        StringType,
-                                                                    ),
-                                                                    Property(
-                                                                        "background",
-                                                                        StringType,
-                                                                    ),
-                                                                    Property(
-                                                                        "isNumberColumnEnabled",
-                                                                        BooleanType,
-                                                                    ),
-                                                                    Property(
-                                                                        "localId",
-                                                                        StringType,
-                                                                    ),
-                                                                    Property(
-                                                                        "color",
-                                                                        StringType,
-                                                                    ),
-                                                                    Property(
-                                                                        "panelType",
-                                                                        StringType,
-                                                                    ),
-                                                                    Property(
-                                                                        "level",
-                                                                        IntegerType,
-                                                                    ),
-                                                                    Property(
-                                                                        "accessLevel",
-                                                                        StringType,
-                                                                    ),
-                                                                    Property(
-                                                                        "style",
-                                                                        StringType,
-                                                                    ),
-                                                                    Property(
-                                                                        "order",
-                                                                        IntegerType,
-                                                                    ),
-                                                                    Property(
-                                                                        "text",
-                                                                        StringType,
-                                                                    ),
-                                                                    Property(
-                                                                        "shortName",
-                                                                        StringType,
-                                                                    ),
-                                                                    Property(
-                                                                        "url",
-                                                                        StringType,
-                                                                    ),
-                                                                    Property(
-                                                                        "layout",
-                                                                        StringType,
-                                                                    ),
-                                                                    Property(
-                                                                        "id", StringType
-                                                                    ),
-                                                                    Property(
-                                                                        "type",
-                                                                        StringType,
-                                                                    ),
-                                                                    Property(
-                                                                        "collection",
-                                                                        StringType,
-                                                                    ),
-                                                                    Property(
-                                                                        "width",
-                                                                        NumberType,
-                                                                    ),
-                                                                    Property(
-                                                                        "height",
-                                                                        NumberType,
-                                                                    ),
-                                                                    Property(
-                                                                        "occurrenceKey",
-                                                                        StringType,
-                                                                    ),
-                                                                ),
-                                                            ),
-                                                        ),
-                                                    ),
-                                                ),
-                                                Property(
-                                                    "content",
-                                                    ArrayType(
-                                                        ObjectType(
-                                                            Property(
-                                                                "content",
-                                                                ArrayType(
-                                                                    ObjectType(
-                                                                        Property(
-                                                                            "version",
-                                                                            IntegerType,
-                                                                        ),
-                                                                        Property(
-                                                                            "text",
-                                                                            StringType,
-                                                                        ),
-                                                                        Property(
-                                                                            "type",
-                                                                            StringType,
-                                                                        ),
-                                                                        Property(
-                                                                            "content",
-                                                                            __content_schema,
-                                                                        ),
-                                                                        Property(
-                                                                            "attrs",
-                                                                            ObjectType(
-                                                                                Property(
-                                                                                    "href",
-                                                                                    StringType,
-                                                                                ),
-                                                                                Property(
-                                                                                    "colspan",
-                                                                                    IntegerType,
-                                                                                ),
-                                                                                Property(
-                                                                                    "alt",
-                                                                                    StringType,
-                                                                                ),
-                                                                                Property(
-                                                                                    "timestamp",
-                                                                                    StringType,
-                                                                                ),
-                                                                                Property(
-                                                                                    "colwidth",
-                                                                                    ArrayType(
-                                                                                        IntegerType
-                                                                                    ),
-                                                                                ),
-                                                                                Property(
-                                                                                    "language",
-                                                                                    StringType,
-                                                                                ),
-                                                                                Property(
-                                                                                    "background",
-                                                                                    StringType,
-                                                                                ),
-                                                                                Property(
-                                                                                    "isNumberColumnEnabled",
-                                                                                    BooleanType,
-                                                                                ),
-                                                                                Property(
-                                                                                    "localId",
-                                                                                    StringType,
-                                                                                ),
-                                                                                Property(
-                                                                                    "color",
-                                                                                    StringType,
-                                                                                ),
-                                                                                Property(
-                                                                                    "panelType",
-                                                                                    StringType,
-                                                                                ),
-                                                                                Property(
-                                                                                    "level",
-                                                                                    IntegerType,
-                                                                                ),
-                                                                                Property(
-                                                                                    "accessLevel",
-                                                                                    StringType,
-                                                                                ),
-                                                                                Property(
-                                                                                    "style",
-                                                                                    StringType,
-                                                                                ),
-                                                                                Property(
-                                                                                    "order",
-                                                                                    IntegerType,
-                                                                                ),
-                                                                                Property(
-                                                                                    "text",
-                                                                                    StringType,
-                                                                                ),
-                                                                                Property(
-                                                                                    "shortName",
-                                                                                    StringType,
-                                                                                ),
-                                                                                Property(
-                                                                                    "url",
-                                                                                    StringType,
-                                                                                ),
-                                                                                Property(
-                                                                                    "layout",
-                                                                                    StringType,
-                                                                                ),
-                                                                                Property(
-                                                                                    "id",
-                                                                                    StringType,
-                                                                                ),
-                                                                                Property(
-                                                                                    "type",
-                                                                                    StringType,
-                                                                                ),
-                                                                                Property(
-                                                                                    "collection",
-                                                                                    StringType,
-                                                                                ),
-                                                                                Property(
-                                                                                    "width",
-                                                                                    NumberType,
-                                                                                ),
-                                                                                Property(
-                                                                                    "height",
-                                                                                    NumberType,
-                                                                                ),
-                                                                                Property(
-                                                                                    "occurrenceKey",
-                                                                                    StringType,
-                                                                                ),
-                                                                            ),
-                                                                        ),
-                                                                        Property(
-                                                                            "marks",
-                                                                            ArrayType(
-                                                                                ObjectType(
-                                                                                    Property(
-                                                                                        "type",
-                                                                                        StringType,
-                                                                                    ),
-                                                                                    Property(
-                                                                                        "attrs",
-                                                                                        ObjectType(
-                                                                                            Property(
-                                                                                                "href",
-                                                                                                StringType,
-                                                                                            ),
-                                                                                            Property(
-                                                                                                "colspan",
-                                                                                                IntegerType,
-                                                                                            ),
-                                                                                            Property(
-                                                                                                "alt",
-                                                                                                StringType,
-                                                                                            ),
-                                                                                            Property(
-                                                                                                "timestamp",
-                                                                                                StringType,
-                                                                                            ),
-                                                                                            Property(
-                                                                                                "colwidth",
-                                                                                                ArrayType(
-                                                                                                    IntegerType
-                                                                                                ),
-                                                                                            ),
-                                                                                            Property(
-                                                                                                "language",
-                                                                                                StringType,
-                                                                                            ),
-                                                                                            Property(
-                                                                                                "background",
-                                                                                                StringType,
-                                                                                            ),
-                                                                                            Property(
-                                                                                                "isNumberColumnEnabled",
-                                                                                                BooleanType,
-                                                                                            ),
-                                                                                            Property(
-                                                                                                "localId",
-                                                                                                StringType,
-                                                                                            ),
-                                                                                            Property(
-                                                                                                "color",
-                                                                                                StringType,
-                                                                                            ),
-                                                                                            Property(
-                                                                                                "panelType",
-                                                                                                StringType,
-                                                                                            ),
-                                                                                            Property(
-                                                                                                "level",
-                                                                                                IntegerType,
-                                                                                            ),
-                                                                                            Property(
-                                                                                                "accessLevel",
-                                                                                                StringType,
-                                                                                            ),
-                                                                                            Property(
-                                                                                                "style",
-                                                                                                StringType,
-                                                                                            ),
-                                                                                            Property(
-                                                                                                "order",
-                                                                                                IntegerType,
-                                                                                            ),
-                                                                                            Property(
-                                                                                                "text",
-                                                                                                StringType,
-                                                                                            ),
-                                                                                            Property(
-                                                                                                "shortName",
-                                                                                                StringType,
-                                                                                            ),
-                                                                                            Property(
-                                                                                                "url",
-                                                                                                StringType,
-                                                                                            ),
-                                                                                            Property(
-                                                                                                "layout",
-                                                                                                StringType,
-                                                                                            ),
-                                                                                            Property(
-                                                                                                "id",
-                                                                                                StringType,
-                                                                                            ),
-                                                                                            Property(
-                                                                                                "type",
-                                                                                                StringType,
-                                                                                            ),
-                                                                                            Property(
-                                                                                                "collection",
-                                                                                                StringType,
-                                                                                            ),
-                                                                                            Property(
-                                                                                                "width",
-                                                                                                NumberType,
-                                                                                            ),
-                                                                                            Property(
-                                                                                                "height",
-                                                                                                NumberType,
-                                                                                            ),
-                                                                                            Property(
-                                                                                                "occurrenceKey",
-                                                                                                StringType,
-                                                                                            ),
-                                                                                        ),
-                                                                                    ),
-                                                                                ),
-                                                                            ),
-                                                                        ),
-                                                                    )
-                                                                ),
-                                                            ),
-                                                            Property(
-                                                                "type", StringType
-                                                            ),
-                                                            Property(
-                                                                "version", IntegerType
-                                                            ),
-                                                        ),
-                                                    ),
-                                                ),
-                                            ),
-                                        ),
-                                    ),
-                                ),
-                            ),
-                        ),
-                    ),
-                ),
-                Property("customfield_10010", ArrayType(base_item_schema)),
-                Property("customfield_10014", StringType),
-                Property("timetracking", StringType),
-                Property("customfield_10015", StringType),
-                Property(
-                    "customfield_10005",
-                    ArrayType(
-                        ObjectType(
-                            Property("id", IntegerType),
-                            Property("boardId", IntegerType),
-                            Property("name", StringType),
-                            Property("state", StringType),
-                            Property("goal", DateTimeType),
-                            Property("startDate", DateTimeType),
-                            Property("completeDate", DateTimeType),
-                        )
-                    ),
-                ),
-                Property("customfield_10006", StringType),
-                Property("customfield_10007", StringType),
-                Property("security", StringType),
-                Property("customfield_10008", base_item_schema),
-                Property("aggregatetimeestimate", IntegerType),
-                Property("customfield_10009", StringType),
-                Property("attachment", ArrayType(StringType)),
-                Property("summary", StringType),
-                Property(
-                    "creator",
-                    ObjectType(
-                        Property("self", StringType),
-                        Property("accountId", StringType),
-                        Property("emailAddress", StringType),
-                        Property(
-                            "avatarUrls",
-                            ObjectType(
-                                Property("48x48", StringType),
-                                Property("24x24", StringType),
-                                Property("16x16", StringType),
-                                Property("32x32", StringType),
-                            ),
-                        ),
-                        Property("displayName", StringType),
-                        Property("active", BooleanType),
-                        Property("timeZone", StringType),
-                        Property("accountType", StringType),
-                    ),
-                ),
-                Property(
-                    "subtasks",
-                    ArrayType(
+                    Property("comment", StringType),
+                    Property(
+                        "votes",
                         ObjectType(
-                            Property("id", StringType),
-                            Property("key", StringType),
                             Property("self", StringType),
-                            Property(
-                                "fields",
-                                ObjectType(
-                                    Property("summary", StringType),
-                                    Property(
-                                        "status",
-                                        ObjectType(
-                                            Property("self", StringType),
-                                            Property("description", StringType),
-                                            Property("iconUrl", StringType),
-                                            Property("name", StringType),
-                                            Property("id", StringType),
-                                            Property(
-                                                "statusCategory",
-                                                ObjectType(
-                                                    Property("self", StringType),
-                                                    Property("id", IntegerType),
-                                                    Property("key", StringType),
-                                                    Property("colorName", StringType),
-                                                    Property("name", StringType),
-                                                ),
-                                            ),
-                                        ),
-                                    ),
-                                    Property(
-                                        "priority",
-                                        ObjectType(
-                                            Property("self", StringType),
-                                            Property("iconUrl", StringType),
-                                            Property("name", StringType),
-                                            Property("id", StringType),
-                                        ),
-                                    ),
-                                    Property(
-                                        "issuetype",
-                                        ObjectType(
-                                            Property("self", StringType),
-                                            Property("id", StringType),
-                                            Property("description", StringType),
-                                            Property("iconUrl", StringType),
-                                            Property("name", StringType),
-                                            Property("subtask", BooleanType),
-                                            Property("avatarId", IntegerType),
-                                            Property("entityId", StringType),
-                                            Property("hierarchyLevel", IntegerType),
-                                        ),
-                                    ),
-                                ),
-                            ),
-                        ),
-                    ),
-                ),
-                Property("customfield_10041", StringType),
-                Property(
-                    "reporter",
-                    ObjectType(
-                        Property("self", StringType),
-                        Property("accountId", StringType),
-                        Property("emailAddress", StringType),
-                        Property(
-                            "avatarUrls",
-                            ObjectType(
-                                Property("48x48", StringType),
-                                Property("24x24", StringType),
-                                Property("16x16", StringType),
-                                Property("32x32", StringType),
-                            ),
-                        ),
-                        Property("displayName", StringType),
-                        Property("active", BooleanType),
-                        Property("timeZone", StringType),
-                        Property("accountType", StringType),
-                    ),
-                ),
-                Property("customfield_10043", StringType),
-                Property("customfield_10044", StringType),
-                Property(
-                    "aggregateprogress",
-                    ObjectType(
-                        Property("progress", IntegerType),
-                        Property("total", IntegerType),
-                        Property("percent", IntegerType),
-                    ),
-                ),
-                Property("customfield_10045", StringType),
-                Property("customfield_10001", ArrayType(StringType)),
-                Property("customfield_10002", NumberType),
-                Property("customfield_10003", NumberType),
-                Property("customfield_10004", StringType),
-                Property("customfield_10038", StringType),
-                Property("customfield_10039", StringType),
-                Property("customfield_10000", ArrayType(base_item_schema)),
-                Property("customfield_10042", StringType),
-                Property("customfield_10046", StringType),
-                Property("customfield_10047", StringType),
-                Property(
-                    "environment",
-                    ObjectType(
-                        Property("type", StringType),
-                        Property(
-                            "content",
-                            ArrayType(
-                                ObjectType(
-                                    Property(
-                                        "content",
-                                        ArrayType(
-                                            ObjectType(
-                                                Property("text", StringType),
-                                                Property("type", StringType),
-                                            ),
-                                        ),
-                                    ),
-                                    Property("type", StringType),
-                                ),
-                            ),
+                            Property("votes", IntegerType),
+                            Property("hasVoted", BooleanType),
                         ),
-                        Property("text", StringType),
-                        Property("version", IntegerType),
-                    ),
-                ),
-                Property("duedate", StringType),
-                Property(
-                    "progress",
-                    ObjectType(
-                        Property("progress", IntegerType),
-                        Property("total", IntegerType),
-                    ),
-                ),
-                Property("comment", StringType),
-                Property(
-                    "votes",
-                    ObjectType(
-                        Property("self", StringType),
-                        Property("votes", IntegerType),
-                        Property("hasVoted", BooleanType),
-                    ),
-                ),
-                Property("worklog", StringType),
-                Property("key", StringType),
-                Property("id", IntegerType),
-                Property("editmeta", StringType),
-                Property("histories", StringType),
-                Property("customfield_11394", StringType),
-                Property("customfield_11395", StringType),
-                Property("customfield_11397", StringType),
-                Property("customfield_11396", base_item_schema),
-                Property("customfield_11399", StringType),
-                Property("customfield_11398", DateType),
-                Property("customfield_11384", base_item_schema),
-                Property("customfield_11385", StringType),
-                Property("customfield_10600", base_item_schema),
-                Property("customfield_11490", base_item_schema),
-                Property("customfield_11492", StringType),
-                Property(
-                    "customfield_11371",
-                    base_item_schema,
-                ),
-                Property(
-                    "customfield_11370",
-                    base_item_schema,
-                ),
-                Property("customfield_11491", base_item_schema),
-                Property(
-                    "customfield_11373",
-                    base_item_schema,
-                ),
-                Property(
-                    "customfield_11494",
-                    base_item_schema,
-                ),
-                Property(
-                    "customfield_11493",
-                    base_item_schema,
-                ),
-                Property(
-                    "customfield_11372",
-                    base_item_schema,
-                ),
-                Property(
-                    "customfield_11496",
-                    base_item_schema,
-                ),
-                Property(
-                    "customfield_11375",
-                    base_item_schema,
-                ),
-                Property(
-                    "customfield_11495",
-                    base_item_schema,
-                ),
-                Property(
-                    "customfield_11374",
-                    base_item_schema,
-                ),
-                Property(
-                    "customfield_11498",
-                    base_item_schema,
-                ),
-                Property("customfield_11377", StringType),
-                Property("customfield_11497", NumberType),
-                Property("customfield_11376", StringType),
-                Property("customfield_11379", ArrayType(base_item_schema)),
-                Property("customfield_11378", ArrayType(base_item_schema)),
-                Property(
-                    "customfield_11369",
-                    base_item_schema,
-                ),
-                Property("customfield_11481", ArrayType(base_item_schema)),
-                Property("customfield_11482", base_item_schema),
-                Property("customfield_11485", StringType),
-                Property("customfield_11000", StringType),
-                Property("customfield_11487", StringType),
-                Property("customfield_11486", StringType),
-                Property("customfield_11489", base_item_schema),
-                Property("customfield_11368", DateType),
-                Property("customfield_11488", StringType),
-                Property("customfield_11359", DateType),
-                Property("customfield_11358", StringType),
-                Property("customfield_10701", StringType),
-                Property("customfield_11470", NumberType),
-                Property("customfield_11591", base_item_schema),
-                Property("customfield_11472", NumberType),
-                Property("customfield_11350", base_item_schema),
-                Property("customfield_11353", base_item_schema),
-                Property("customfield_11594", StringType),
-                Property("customfield_11473", StringType),
-                Property("customfield_11355", base_item_schema),
-                Property("customfield_11596", NumberType),
-                Property("customfield_11354", base_item_schema),
-                Property("customfield_11475", base_item_schema),
-                Property("customfield_11357", StringType),
-                Property("customfield_11356", StringType),
-                Property("customfield_11598", StringType),
-                Property("customfield_11469", base_item_schema),
-                Property("customfield_11468", NumberType),
-                Property("customfield_11347", StringType),
-                Property("customfield_11582", base_item_schema),
-                Property("customfield_11461", NumberType),
-                Property("customfield_11340", StringType),
-                Property("customfield_11460", StringType),
-                # Property("customfield_11584", StringType),
-                Property("customfield_11463", NumberType),
-                Property("customfield_11341", base_item_schema),
-                Property("customfield_11583", base_item_schema),
-                Property(
-                    "customfield_11100",
-                    ArrayType(
-                        ObjectType(
-                            Property("_link", StringType),
-                            Property("id", StringType),
-                            Property("name", StringType),
-                        )
-                    ),
-                ),
-                Property("customfield_11586", StringType),
-                Property("customfield_11344", NumberType),
-                Property("customfield_11465", DateType),
-                Property("customfield_11585", StringType),
-                Property("customfield_11464", NumberType),
-                Property("customfield_11346", StringType),
-                Property("customfield_11467", base_item_schema),
-                Property("customfield_11466", NumberType),
-                Property("customfield_11345", StringType),
-                Property("customfield_11587", StringType),
-                # Property("customfield_11458", StringType),
-                Property("customfield_11336", NumberType),
-                Property("customfield_11457", base_item_schema),
-                Property("customfield_11339", StringType),
-                Property("customfield_11459", NumberType),
-                Property(
-                    "customfield_10800",
-                    ObjectType(
-                        Property("hasEpicLinkFieldDependency", BooleanType),
-                        Property(
-                            "nonEditableReason",
-                            ObjectType(
-                                Property("message", StringType),
-                                Property("reason", StringType),
-                            ),
-                            Property("showField", BooleanType),
-                        ),
-                        Property("showField", BooleanType),
-                    ),
-                ),
-                Property("customfield_11338", base_item_schema),
-                Property("customfield_11450", ArrayType(base_item_schema)),
-                Property(
-                    "customfield_11331",
-                    ObjectType(
-                        Property("displayName", StringType),
-                        Property("languageCode", StringType),
-                    ),
-                ),
-                Property("customfield_11452", base_item_schema),
-                Property(
-                    "customfield_11330",
-                    ObjectType(Property("errorMessage", StringType)),
-                ),
-                Property("customfield_11451", StringType),
-                Property("customfield_11454", base_item_schema),
-                Property("customfield_11333", base_item_schema),
-                Property("customfield_11575", base_item_schema),
-                Property("customfield_11453", DateType),
-                Property("customfield_11332", StringType),
-                Property("customfield_11335", base_content_schema),
-                Property("customfield_11576", StringType),
-                Property(
-                    "customfield_11334",
-                    base_item_schema,
-                ),
-                Property("customfield_11342", base_item_schema),
-                Property("customfield_11455", ArrayType(base_item_schema)),
-                Property("customfield_11326", ArrayType(base_item_schema)),
-                Property("customfield_11447", ArrayType(base_item_schema)),
-                Property("customfield_11568", NumberType),
-                Property("customfield_11567", NumberType),
-                Property("customfield_11446", ArrayType(base_item_schema)),
-                Property("customfield_11325", ArrayType(base_item_schema)),
-                Property(
-                    "customfield_11328",
-                    ObjectType(Property("errorMessage", StringType)),
-                ),
-                Property("customfield_11449", ArrayType(base_item_schema)),
-                Property(
-                    "customfield_11327",
-                    ObjectType(Property("errorMessage", StringType)),
-                ),
-                Property("customfield_11448", ArrayType(base_item_schema)),
-                Property(
-                    "customfield_11329",
-                    ObjectType(Property("errorMessage", StringType)),
-                ),
-                Property("customfield_11560", StringType),
-                Property("customfield_11441", StringType),
-                Property(
-                    "customfield_11562",
-                    base_item_schema,
-                ),
-                Property("customfield_11320", base_item_schema),
-                Property("customfield_11561", base_content_schema),
-                Property("customfield_11443", StringType),
-                Property("customfield_11200", base_item_schema),
-                Property("customfield_11321", base_item_schema),
-                Property("customfield_11564", base_content_schema),
-                #
-                # Custom definitions for UC Jira
-                #
-                Property(
-                    "customfield_11442",
-                    base_item_schema,
-                ),
-                Property(
-                    "customfield_10116",
-                    ObjectType(
-                        Property("avatarUrl", StringType),
-                        Property("id", StringType),
-                        Property("isShared", BooleanType),
-                        Property("isVisible", BooleanType),
-                        Property("name", StringType),
-                        Property("title", StringType)
-                    ),
-                ),
-                Property(
-                    "customfield_11537",
-                    base_item_schema,
-                ),
-                # End custom definitions
-                Property("customfield_11322", base_item_schema),
-                Property("customfield_11563", base_content_schema),
-                Property("customfield_11323", StringType),
-                Property("customfield_11566", NumberType),
-                Property("customfield_11445", StringType),
-                Property("customfield_11324", StringType),
-                Property("customfield_11565", NumberType),
-                Property("customfield_11444", StringType),
-                Property("customfield_11557", StringType),
-                Property("customfield_11314", base_item_schema),
-                Property("customfield_11436", StringType),
-                Property("customfield_11435", StringType),
-                Property("customfield_11556", StringType),
-                Property("customfield_11315", DateTimeType),
-                Property("customfield_11559", base_item_schema),
-                Property("customfield_11316", DateTimeType),
-                Property("customfield_11438", StringType),
-                Property("customfield_11437", StringType),
-                Property("customfield_11558", base_item_schema),
-                Property("customfield_11317", base_item_schema),
-                Property("customfield_11318", base_item_schema),
-                Property("customfield_11319", base_item_schema),
-                Property("customfield_11439", StringType),
-                Property("customfield_11430", base_item_schema),
-                Property("customfield_11310", ArrayType(base_item_schema)),
-                Property("customfield_10100", StringType),
-                Property("customfield_11431", ArrayType(base_item_schema)),
-                Property("customfield_11311", base_item_schema),
-                Property("customfield_11434", NumberType),
-                Property("customfield_11312", base_item_schema),
-                Property("customfield_11555", base_item_schema),
-                Property("customfield_11433", StringType),
-                Property("customfield_11313", base_item_schema),
-                Property("customfield_11425", NumberType),
-                Property("customfield_11303", DateType),
-                Property("customfield_11667", StringType),
-                Property("customfield_11666", ArrayType(base_item_schema)),
-                Property("customfield_11545", base_content_schema),
-                Property("customfield_11424", NumberType),
-                Property(
-                    "customfield_11305",
-                    ObjectType(
-                        Property(
-                            "_links",
-                            ObjectType(
-                                Property("agent", StringType),
-                                Property("jiraRest", StringType),
-                                Property("self", StringType),
-                                Property("web", StringType),
-                            ),
-                        ),
-                        Property(
-                            "currentStatus",
-                            ObjectType(
-                                Property("status", StringType),
-                                Property("statusCategory", StringType),
-                                Property(
-                                    "statusDate",
-                                    ObjectType(
-                                        Property("epochMillis", IntegerType),
-                                        Property("friendly", DateTimeType),
-                                        Property("iso8601", DateTimeType),
-                                        Property("jira", DateTimeType),
-                                    ),
-                                ),
-                            ),
-                        ),
-                        Property(
-                            "requestType",
-                            ObjectType(
-                                Property("_expands", ArrayType(StringType)),
-                                Property(
-                                    "_links", ObjectType(Property("self", StringType))
-                                ),
-                                Property("description", StringType),
-                                Property("groupIds", ArrayType(StringType)),
-                                Property("id", StringType),
-                                Property("issueTypeId", StringType),
-                                Property("name", StringType),
-                                Property("portalId", StringType),
-                                Property("serviceDeskId", StringType),
-                            ),
-                        ),
-                    ),
-                ),
-                Property("customfield_11615", StringType),
-                Property("customfield_11427", NumberType),
-                Property("customfield_11548", base_item_schema),
-                Property("customfield_11668", base_item_schema),
-                Property("customfield_11306", ArrayType(base_item_schema)),
-                Property("customfield_11307", NumberType),
-                Property("customfield_11429", base_item_schema),
-                Property("customfield_11308", base_item_schema),
-                Property("customfield_11428", NumberType),
-                Property("customfield_11549", StringType),
-                Property("customfield_11309", DateTimeType),
-                Property("customfield_11661", base_item_schema),
-                Property("customfield_11660", base_content_schema),
-                Property("customfield_11421", NumberType),
-                Property("customfield_11663", NumberType),
-                Property("customfield_11420", NumberType),
-                Property("customfield_11300", StringType),
-                Property("customfield_11665", StringType),
-                Property("customfield_11301", DateType),
-                Property("customfield_11423", NumberType),
-                Property("customfield_11302", base_item_schema),
-                Property("customfield_11422", NumberType),
-                Property("customfield_11664", StringType),
-                Property("customfield_11414", DateTimeType),
-                Property("customfield_11656", StringType),
-                Property("customfield_11413", base_item_schema),
-                Property("customfield_11658", StringType),
-                Property("customfield_11415", DateType),
-                Property("customfield_11657", base_item_schema),
-                Property("customfield_11418", DateType),
-                Property("customfield_11659", StringType),
-                Property("customfield_11652", base_item_schema),
-                Property("customfield_11410", StringType),
-                Property("customfield_11530", base_content_schema),
-                Property("customfield_11411", StringType),
-                Property("customfield_11524", base_item_schema),
-                Property("customfield_11403", DateType),
-                Property("customfield_11645", NumberType),
-                Property("customfield_11402", ArrayType(base_item_schema)),
-                Property("customfield_11644", NumberType),
-                Property("customfield_11523", DateType),
-                Property("customfield_11647", StringType),
-                Property("customfield_11405", StringType),
-                Property("customfield_11526", StringType),
-                Property("customfield_11404", StringType),
-                Property("customfield_11525", StringType),
-                Property("customfield_11528", base_content_schema),
-                Property("customfield_11649", StringType),
-                Property("customfield_11648", ArrayType(base_item_schema)),
-                Property("customfield_11527", StringType),
-                Property("customfield_11529", StringType),
-                Property("customfield_11641", StringType),
-                Property("customfield_11520", base_item_schema),
-                Property("customfield_11640", StringType),
-                Property("customfield_11643", NumberType),
-                Property("customfield_11522", DateType),
-                Property("customfield_11401", StringType),
-                Property("customfield_11400", StringType),
-                Property("customfield_11642", NumberType),
-                Property("customfield_11521", base_item_schema),
-                Property("customfield_11513", DateType),
-                Property("customfield_10302", DateTimeType),
-                Property("customfield_11512", ArrayType(base_item_schema)),
-                Property("customfield_11515", ArrayType(base_item_schema)),
-                Property("customfield_11514", DateType),
-                Property("customfield_11638", base_item_schema),
-                Property("customfield_11517", ArrayType(StringType)),
-                Property("customfield_11516", base_item_schema),
-                Property("customfield_11637", base_item_schema),
-                Property("customfield_11519", base_item_schema),
-                Property("customfield_11639", base_item_schema),
-                Property("customfield_11518", StringType),
-                Property("customfield_10300", StringType),
-                Property("customfield_11511", StringType),
-                Property("customfield_10301", StringType),
-                Property("customfield_11510", base_item_schema),
-                Property("customfield_11502", NumberType),
-                Property("customfield_11501", StringType),
-                Property("customfield_11503", base_item_schema),
-                Property("customfield_11505", base_item_schema),
-                Property("customfield_11508", DateType),
-                Property("customfield_11507", base_item_schema),
-                Property("customfield_11509", StringType),
-                Property("customfield_11618", base_item_schema),
-                Property("customfield_11610", NumberType),
-                Property("customfield_11600", base_item_schema),
-                Property("customfield_11380", StringType),
-                Property("customfield_11382", StringType),
-                Property("customfield_11381", StringType),
-                Property("customfield_11480", base_item_schema),
-                Property("customfield_11479", StringType),
-                Property("customfield_11590", NumberType),
-                Property("customfield_11478", StringType),
-                Property("customfield_11477", StringType),
-                Property("customfield_11348", NumberType),
-                Property("customfield_11349", base_item_schema),
-                Property("customfield_11343", base_item_schema),
-                Property("customfield_11571", base_item_schema),
-                Property("customfield_11573", base_item_schema),
-                Property("customfield_11572", NumberType),
-                Property("customfield_11574", base_item_schema),
-                Property("customfield_11577", base_item_schema),
-                Property("customfield_11569", StringType),
-                Property("customfield_11551", NumberType),
-                Property("customfield_11550", StringType),
-                Property("customfield_11553", NumberType),
-                Property("customfield_11552", StringType),
-                Property("customfield_11554", NumberType),
-                Property("customfield_11540", base_item_schema),
-                Property("customfield_11541", base_item_schema),
-                Property("customfield_11543", StringType),
-                Property("customfield_11617", StringType),
-                Property("customfield_11504", base_item_schema),
-                Property("customfield_11616", NumberType),
-            ),
-        ),
-        Property("created", StringType),
-        Property("updated", StringType),
-    ).to_dict()
-
-    def get_url_params(
-        self,
-        context: dict | None,
-        next_page_token: Any | None,
-    ) -> dict[str, Any]:
-        params: dict = {}
-
-        params["maxResults"] = self.config.get("page_size", {}).get("issues", 10)
-
-        params["jql"] = []  # init a query param
-
-        if next_page_token:
-            params["startAt"] = next_page_token
-
-        if self.replication_key:
-            params["sort"] = "asc"
-            params["order_by"] = self.replication_key
-
-        if "start_date" in self.config:
-            start_date = self.config["start_date"]
-            params["jql"].append(f"(created>={start_date} or updated>={start_date})")
-
-        if "end_date" in self.config:
-            end_date = self.config["end_date"]
-            params["jql"].append(f"(created<{end_date} or updated<{start_date})")
-
-        if params["jql"]:
-            jql = " and ".join(params["jql"])
-            params["jql"] = jql
-
-        else:
-            params.pop("jql")  # drop if there's no query
-
-        return params
-
-    def get_child_context(self, record: dict, context: Optional[dict]) -> dict:
-        """Return a context dictionary for child streams."""
-        return {"issue_id": record["id"]}
-
-    def post_process(self, row: dict, context: dict | None = None) -> dict | None:
-        # dafault value for array, would remove once handled at SDK level
-        for key_set_default in [
-            "customfield_10010",
-            "customfield_10005",
-            "customfield_10001",
-            "customfield_10000",
-            "customfield_11379",
-            "customfield_11378",
-            "customfield_11481",
-            "customfield_11481",
-            "customfield_11100",
-            "customfield_11450",
-            "customfield_11455",
-            "customfield_11326",
-            "customfield_11447",
-            "customfield_11446",
-            "customfield_11325",
-            "customfield_11449",
-            "customfield_11448",
-            "customfield_11310",
-            "customfield_11431",
-            "customfield_11666",
-            "customfield_11402",
-            "customfield_11648",
-            "customfield_11512",
-            "customfield_11515",
-        ]:
-            if row["fields"].get(key_set_default) is None:
-                row["fields"][key_set_default] = []
-        return row
-
-
-class PermissionStream(JiraStream):
-
-    """
-    https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-permissions/#api-rest-api-3-permissions-get
-    """
-
-    """
-    name: stream name
-    path: path which will be added to api url in client.py
-    schema: instream schema
-    primary_keys = primary keys for the table
-    replication_key = datetime keys for replication
-    """
-
-    name = "permissions"
-    path = "/permissions"
-    primary_keys = ["permissions"]
-    replication_key = "permissions"
-    replication_method = "INCREMENTAL"
-    instance_name = ""
-
-    schema = PropertiesList(
-        Property(
-            "permissions",
-            ObjectType(
-                Property(
-                    "ADD_COMMENTS",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
-                    ),
-                ),
-                Property(
-                    "ADMINISTER_PROJECTS",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
-                    ),
-                ),
-                Property(
-                    "DELETE_ALL_WORKLOGS",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
-                    ),
-                ),
-                Property(
-                    "ADMINISTER",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
-                    ),
-                ),
-                Property(
-                    "ADMINISTER_PROJECT",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
-                    ),
-                ),
-                Property(
-                    "ASSIGNABLE_USER",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
-                    ),
-                ),
-                Property(
-                    "ASSIGN_ISSUES",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
-                    ),
-                ),
-                Property(
-                    "BROWSE_PROJECTS",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
-                    ),
-                ),
-                Property(
-                    "BULK_CHANGE",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
-                    ),
-                ),
-                Property(
-                    "CLOSE_ISSUES",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
-                    ),
-                ),
-                Property(
-                    "CREATE_ATTACHMENTS",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
-                    ),
-                ),
-                Property(
-                    "CREATE_ISSUES",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
-                    ),
-                ),
-                Property(
-                    "CREATE_PROJECT",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
-                    ),
-                ),
-                Property(
-                    "CREATE_SHARED_OBJECTS",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
-                    ),
-                ),
-                Property(
-                    "DELETE_ALL_ATTACHMENTS",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
                     ),
-                ),
-                Property(
-                    "DELETE_ALL_COMMENTS",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
-                    ),
-                ),
-                Property(
-                    "DELETE_ALL_WORKLOG",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
-                    ),
-                ),
-                Property(
-                    "DELETE_ISSUES",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
-                    ),
-                ),
-                Property(
-                    "DELETE_OWN_ATTACHMENTS",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
-                    ),
-                ),
-                Property(
-                    "DELETE_OWN_COMMENTS",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
+                    Property("worklog", StringType),
+                    Property("key", StringType),
+                    Property("id", IntegerType),
+                    Property("editmeta", StringType),
+                    Property("histories", StringType),
+                    Property(
+                        "customfield_11371",
+                        _BASE_ITEM_SCHEMA,
                     ),
-                ),
-                Property(
-                    "DELETE_OWN_WORKLOGS",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
+                    Property(
+                        "customfield_11370",
+                        _BASE_ITEM_SCHEMA,
                     ),
-                ),
-                Property(
-                    "EDIT_ALL_COMMENTS",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
+                    Property(
+                        "customfield_11373",
+                        _BASE_ITEM_SCHEMA,
                     ),
-                ),
-                Property(
-                    "EDIT_ALL_WORKLOGS",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
+                    Property(
+                        "customfield_11494",
+                        _BASE_ITEM_SCHEMA,
                     ),
-                ),
-                Property(
-                    "EDIT_ISSUES",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
+                    Property(
+                        "customfield_11493",
+                        _BASE_ITEM_SCHEMA,
                     ),
-                ),
-                Property(
-                    "EDIT_OWN_COMMENTS",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
+                    Property(
+                        "customfield_11372",
+                        _BASE_ITEM_SCHEMA,
                     ),
-                ),
-                Property(
-                    "EDIT_OWN_WORKLOGS",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
+                    Property(
+                        "customfield_11496",
+                        _BASE_ITEM_SCHEMA,
                     ),
-                ),
-                Property(
-                    "LINK_ISSUES",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
+                    Property(
+                        "customfield_11375",
+                        _BASE_ITEM_SCHEMA,
                     ),
-                ),
-                Property(
-                    "MANAGE_GROUP_FILTER_SUBSCRIPTIONS",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
+                    Property(
+                        "customfield_11495",
+                        _BASE_ITEM_SCHEMA,
                     ),
-                ),
-                Property(
-                    "MANAGE_SPRINTS_PERMISSION",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
+                    Property(
+                        "customfield_11374",
+                        _BASE_ITEM_SCHEMA,
                     ),
-                ),
-                Property(
-                    "MANAGE_WATCHERS",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
+                    Property(
+                        "customfield_11498",
+                        _BASE_ITEM_SCHEMA,
                     ),
-                ),
-                Property(
-                    "MODIFY_REPORTER",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
+                    Property(
+                        "customfield_11369",
+                        _BASE_ITEM_SCHEMA,
                     ),
-                ),
-                Property(
-                    "MOVE_ISSUES",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
+                    # Property("customfield_11584", StringType),
+                    Property(
+                        "customfield_11100",
+                        ArrayType(
+                            ObjectType(
+                                Property("_link", StringType),
+                                Property("id", StringType),
+                                Property("name", StringType),
+                            )
+                        ),
                     ),
-                ),
-                Property(
-                    "RESOLVE_ISSUES",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
+                    # Property("customfield_11458", StringType),
+                    Property(
+                        "customfield_10800",
+                        ObjectType(
+                            Property("hasEpicLinkFieldDependency", BooleanType),
+                            Property(
+                                "nonEditableReason",
+                                ObjectType(
+                                    Property("message", StringType),
+                                    Property("reason", StringType),
+                                ),
+                                Property("showField", BooleanType),
+                            ),
+                            Property("showField", BooleanType),
+                        ),
                     ),
-                ),
-                Property(
-                    "SCHEDULE_ISSUES",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
+                    Property(
+                        "customfield_11331",
+                        ObjectType(
+                            Property("displayName", StringType),
+                            Property("languageCode", StringType),
+                        ),
                     ),
-                ),
-                Property(
-                    "SET_ISSUE_SECURITY",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
+                    Property(
+                        "customfield_11330",
+                        ObjectType(Property("errorMessage", StringType)),
                     ),
-                ),
-                Property(
-                    "SYSTEM_ADMIN",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
+                    Property(
+                        "customfield_11334",
+                        _BASE_ITEM_SCHEMA,
                     ),
-                ),
-                Property(
-                    "TRANSITION_ISSUES",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
+                    Property(
+                        "customfield_11328",
+                        ObjectType(Property("errorMessage", StringType)),
                     ),
-                ),
-                Property(
-                    "USER_PICKER",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
+                    Property(
+                        "customfield_11327",
+                        ObjectType(Property("errorMessage", StringType)),
                     ),
-                ),
-                Property(
-                    "VIEW_AGGREGATED_DATA",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
+                    Property(
+                        "customfield_11329",
+                        ObjectType(Property("errorMessage", StringType)),
                     ),
-                ),
-                Property(
-                    "VIEW_DEV_TOOLS",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
+                    Property(
+                        "customfield_11562",
+                        _BASE_ITEM_SCHEMA,
                     ),
-                ),
-                Property(
-                    "VIEW_READONLY_WORKFLOW",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
+                    #
+                    # Custom definitions for UC Jira
+                    #
+                    Property(
+                        "customfield_11442",
+                        _BASE_ITEM_SCHEMA,
                     ),
-                ),
-                Property(
-                    "VIEW_VOTERS_AND_WATCHERS",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
+                    Property(
+                        "customfield_10116",
+                        ObjectType(
+                            Property("avatarUrl", StringType),
+                            Property("id", StringType),
+                            Property("isShared", BooleanType),
+                            Property("isVisible", BooleanType),
+                            Property("name", StringType),
+                            Property("title", StringType),
+                        ),
                     ),
-                ),
-                Property(
-                    "WORK_ON_ISSUES",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
+                    Property(
+                        "customfield_11537",
+                        _BASE_ITEM_SCHEMA,
                     ),
-                ),
-                Property(
-                    "com.atlassian.atlas.jira__jira-townsquare-link-unconnected-issue-glance-view-permission",
-                    ObjectType(
-                        Property("key", StringType),
-                        Property("name", StringType),
-                        Property("type", StringType),
-                        Property("description", StringType),
+                    # End custom definitions
+                    Property(
+                        "customfield_11305",
+                        ObjectType(
+                            Property(
+                                "_links",
+                                ObjectType(
+                                    Property("agent", StringType),
+                                    Property("jiraRest", StringType),
+                                    Property("self", StringType),
+                                    Property("web", StringType),
+                                ),
+                            ),
+                            Property(
+                                "currentStatus",
+                                ObjectType(
+                                    Property("status", StringType),
+                                    Property("statusCategory", StringType),
+                                    Property(
+                                        "statusDate",
+                                        ObjectType(
+                                            Property("epochMillis", IntegerType),
+                                            Property("friendly", DateTimeType),
+                                            Property("iso8601", DateTimeType),
+                                            Property("jira", DateTimeType),
+                                        ),
+                                    ),
+                                ),
+                            ),
+                            Property(
+                                "requestType",
+                                ObjectType(
+                                    Property("_expands", ArrayType(StringType)),
+                                    Property(
+                                        "_links",
+                                        ObjectType(Property("self", StringType)),
+                                    ),
+                                    Property("description", StringType),
+                                    Property("groupIds", ArrayType(StringType)),
+                                    Property("id", StringType),
+                                    Property("issueTypeId", StringType),
+                                    Property("name", StringType),
+                                    Property("portalId", StringType),
+                                    Property("serviceDeskId", StringType),
+                                ),
+                            ),
+                        ),
                     ),
                 ),
             ),
-        ),
-    ).to_dict()
+            Property("created", StringType),
+            Property("updated", StringType),
+        ).to_dict()
+
+    @functools.cached_property
+    def _base_params(self) -> dict:
+        """
+        URL parameters that do not change between pages, computed once
+        """
+        params: dict = {}
+
+        params["maxResults"] = self.config.get("page_size", {}).get("issues", 10)
 
+        jql = []
 
-class ProjectRoleStream(JiraStream):
+        if "start_date" in self.config:
+            start_date = self.config["start_date"]
+            jql.append(f"(created>={start_date} or updated>={start_date})")
 
+        if "end_date" in self.config:
+            end_date = self.config["end_date"]
+            jql.append(f"(created<{end_date} or updated<{end_date})")
+
+        jql_text = " and ".join(jql)
+
+        if self.replication_key:
+            # The cursor endpoint takes ordering via JQL, not query params.
+            jql_text = f"{jql_text} ORDER BY {self.replication_key} asc".lstrip()
+
+        if jql_text:
+            params["jql"] = jql_text
+
+        if self._selected_fields is not None:
+            params["fields"] = ",".join(self._selected_fields)
+        else:
+            # The cursor endpoint returns only ids unless fields are named.
+            params["fields"] = "*all"
+
+        return params
+
+    def get_url_params(
+        self,
+        context: dict | None,
+        next_page_token: Any | None,
+    ) -> dict[str, Any]:
+        params = dict(self._base_params)
+
+        if next_page_token:
+            params["nextPageToken"] = next_page_token
+
+        return params
+
+    def get_child_context(self, record: dict, context: Optional[dict]) -> dict:
+        """Return a context dictionary for child streams."""
+        return {"issue_id": record["id"]}
+
+    # Array-typed custom fields that Jira returns as null; defaulted to []
+    # in post_process. Would remove once handled at SDK level.
+    _ARRAY_DEFAULT_FIELDS = (
+        "customfield_10010",
+        "customfield_10005",
+        "customfield_10001",
+        "customfield_10000",
+        "customfield_11379",
+        "customfield_11378",
+        "customfield_11481",
+        "customfield_11100",
+        "customfield_11450",
+        "customfield_11455",
+        "customfield_11326",
+        "customfield_11447",
+        "customfield_11446",
+        "customfield_11325",
+        "customfield_11449",
+        "customfield_11448",
+        "customfield_11310",
+        "customfield_11431",
+        "customfield_11666",
+        "customfield_11402",
+        "customfield_11648",
+        "customfield_11512",
+        "customfield_11515",
+    )
+
+    @functools.cached_property
+    def _array_default_fields(self) -> tuple[str, ...]:
+        """
+        Array-typed fields defaulted per record, restricted to the
+        configured allow-list when one is set
+        """
+        if self._selected_fields is None:
+            return self._ARRAY_DEFAULT_FIELDS
+        keep = set(self._selected_fields)
+        return tuple(name for name in self._ARRAY_DEFAULT_FIELDS if name in keep)
+
+    def post_process(self, row: dict, context: dict | None = None) -> dict | None:
+        fields = row["fields"]
+        for key_set_default in self._array_default_fields:
+            if fields.get(key_set_default) is None:
+                fields[key_set_default] = []
+        if self._adf_as_json_string:
+            description = fields.get("description")
+            if description is not None:
+                fields["description"] = json.dumps(description)
+        return row
+
+
+# Permission keys reported by the permissions endpoint; each maps to the
+# shared _PERMISSION object in PermissionStream._build_schema.
+_PERMISSION_KEYS = (
+    "ADD_COMMENTS",
+    "ADMINISTER_PROJECTS",
+    "DELETE_ALL_WORKLOGS",
+    "ADMINISTER",
+    "ADMINISTER_PROJECT",
+    "ASSIGNABLE_USER",
+    "ASSIGN_ISSUES",
+    "BROWSE_PROJECTS",
+    "BULK_CHANGE",
+    "CLOSE_ISSUES",
+    "CREATE_ATTACHMENTS",
+    "CREATE_ISSUES",
+    "CREATE_PROJECT",
+    "CREATE_SHARED_OBJECTS",
+    "DELETE_ALL_ATTACHMENTS",
+    "DELETE_ALL_COMMENTS",
+    "DELETE_ALL_WORKLOG",
+    "DELETE_ISSUES",
+    "DELETE_OWN_ATTACHMENTS",
+    "DELETE_OWN_COMMENTS",
+    "DELETE_OWN_WORKLOGS",
+    "EDIT_ALL_COMMENTS",
+    "EDIT_ALL_WORKLOGS",
+    "EDIT_ISSUES",
+    "EDIT_OWN_COMMENTS",
+    "EDIT_OWN_WORKLOGS",
+    "LINK_ISSUES",
+    "MANAGE_GROUP_FILTER_SUBSCRIPTIONS",
+    "MANAGE_SPRINTS_PERMISSION",
+    "MANAGE_WATCHERS",
+    "MODIFY_REPORTER",
+    "MOVE_ISSUES",
+    "RESOLVE_ISSUES",
+    "SCHEDULE_ISSUES",
+    "SET_ISSUE_SECURITY",
+    "SYSTEM_ADMIN",
+    "TRANSITION_ISSUES",
+    "USER_PICKER",
+    "VIEW_AGGREGATED_DATA",
+    "VIEW_DEV_TOOLS",
+    "VIEW_READONLY_WORKFLOW",
+    "VIEW_VOTERS_AND_WATCHERS",
+    "WORK_ON_ISSUES",
+    "com.atlassian.atlas.jira__jira-townsquare-link-unconnected-issue-glance-view-permission",
+)
+
+
+class PermissionStream(JiraStream):
+    """
+    https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-permissions/#api-rest-api-3-permissions-get
+    """
+
+    """
+    name: stream name
+    path: path which will be added to api url in client.py
+    schema: instream schema
+    primary_keys = primary keys for the table
+    replication_key = datetime keys for replication
+    """
+
+    name = "permissions"
+    path = "/permissions"
+    primary_keys = ["permissions"]
+    replication_key = "permissions"
+    replication_method = "INCREMENTAL"
+    instance_name = ""
+
+    @classmethod
+    def _build_schema(cls) -> dict:
+        return PropertiesList(
+            Property(
+                "permissions",
+                ObjectType(
+                    *(Property(name, _PERMISSION) for name in _PERMISSION_KEYS),
+                ),
+            ),
+        ).to_dict()
+
+
+class ProjectRoleStream(JiraStream):
     """
     https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-project-roles/#api-rest-api-3-role-get
     """
@@ -2818,53 +1595,54 @@ class ProjectRoleStream(JiraStream):
     replication_method = "INCREMENTAL"
     instance_name = ""
 
-    schema = PropertiesList(
-        Property("self", StringType),
-        Property("name", StringType),
-        Property("id", IntegerType),
-        Property("description", StringType),
-        Property(
-            "scope",
-            ObjectType(
-                Property("type", StringType),
-                Property(
-                    "project",
-                    ObjectType(
-                        Property("id", StringType),
-                    ),
-                ),
-            ),
-        ),
-        Property(
-            "actors",
-            ArrayType(
+    @classmethod
+    def _build_schema(cls) -> dict:
+        return PropertiesList(
+            Property("self", StringType),
+            Property("name", StringType),
+            Property("id", IntegerType),
+            Property("description", StringType),
+            Property(
+                "scope",
                 ObjectType(
-                    Property("id", IntegerType),
-                    Property("displayName", StringType),
                     Property("type", StringType),
-                    Property("name", StringType),
                     Property(
-                        "actorUser",
+                        "project",
                         ObjectType(
-                            Property("accountId", StringType),
+                            Property("id", StringType),
                         ),
                     ),
-                    Property(
-                        "actorGroup",
-                        ObjectType(
-                            Property("name", StringType),
-                            Property("displayName", StringType),
-                            Property("groupId", StringType),
+                ),
+            ),
+            Property(
+                "actors",
+                ArrayType(
+                    ObjectType(
+                        Property("id", IntegerType),
+                        Property("displayName", StringType),
+                        Property("type", StringType),
+                        Property("name", StringType),
+                        Property(
+                            "actorUser",
+                            ObjectType(
+                                Property("accountId", StringType),
+                            ),
+                        ),
+                        Property(
+                            "actorGroup",
+                            ObjectType(
+                                Property("name", StringType),
+                                Property("displayName", StringType),
+                                Property("groupId", StringType),
+                            ),
                         ),
                     ),
                 ),
             ),
-        ),
-    ).to_dict()
+        ).to_dict()
 
 
 class PriorityStream(JiraStream):
-
     """
     https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-issue-priorities/#api-rest-api-3-priority-get
     """
@@ -2884,18 +1662,19 @@ class PriorityStream(JiraStream):
     replication_method = "INCREMENTAL"
     instance_name = ""
 
-    schema = PropertiesList(
-        Property("self", StringType),
-        Property("statusColor", StringType),
-        Property("description", StringType),
-        Property("iconUrl", StringType),
-        Property("name", StringType),
-        Property("id", StringType),
-    ).to_dict()
+    @classmethod
+    def _build_schema(cls) -> dict:
+        return PropertiesList(
+            Property("self", StringType),
+            Property("statusColor", StringType),
+            Property("description", StringType),
+            Property("iconUrl", StringType),
+            Property("name", StringType),
+            Property("id", StringType),
+        ).to_dict()
 
 
 class PermissionHolderStream(JiraStream):
-
     """
     https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-permission-schemes/#api-rest-api-3-permissionscheme-get
     """
@@ -2917,44 +1696,46 @@ class PermissionHolderStream(JiraStream):
     records_jsonpath = "$[permissionSchemes][*]"  # Or override `parse_response`.
     instance_name = "permissionSchemes"
 
-    schema = PropertiesList(
-        Property("expand", StringType),
-        Property("id", IntegerType),
-        Property("self", StringType),
-        Property("name", StringType),
-        Property(
-            "scope",
-            ObjectType(
-                Property("type", StringType),
-                Property(
-                    "project",
-                    ObjectType(
-                        Property("id", StringType),
-                    ),
-                ),
-            ),
-        ),
-        Property("description", StringType),
-        Property(
-            "permissions",
-            ArrayType(
+    @classmethod
+    def _build_schema(cls) -> dict:
+        return PropertiesList(
+            Property("expand", StringType),
+            Property("id", IntegerType),
+            Property("self", StringType),
+            Property("name", StringType),
+            Property(
+                "scope",
                 ObjectType(
-                    Property("id", IntegerType),
-                    Property("self", StringType),
+                    Property("type", StringType),
                     Property(
-                        "holder",
+                        "project",
                         ObjectType(
-                            Property("type", StringType),
-                            Property("parameter", StringType),
-                            Property("value", StringType),
-                            Property("expand", StringType),
+                            Property("id", StringType),
+                        ),
+                    ),
+                ),
+            ),
+            Property("description", StringType),
+            Property(
+                "permissions",
+                ArrayType(
+                    ObjectType(
+                        Property("id", IntegerType),
+                        Property("self", StringType),
+                        Property(
+                            "holder",
+                            ObjectType(
+                                Property("type", StringType),
+                                Property("parameter", StringType),
+                                Property("value", StringType),
+                                Property("expand", StringType),
+                            ),
                         ),
+                        Property("permission", StringType),
                     ),
-                    Property("permission", StringType),
                 ),
             ),
-        ),
-    ).to_dict()
+        ).to_dict()
 
 
 class BoardStream(JiraStream):
@@ -2979,25 +1760,27 @@ class BoardStream(JiraStream):
     records_jsonpath = "$[values][*]"  # Or override `parse_response`.
     instance_name = "values"
 
-    schema = PropertiesList(
-        Property("id", IntegerType),
-        Property("self", StringType),
-        Property("name", StringType),
-        Property("type", StringType),
-        Property(
-            "location",
-            ObjectType(
-                Property("projectId", IntegerType),
-                Property("displayName", StringType),
-                Property("projectName", StringType),
-                Property("projectKey", StringType),
-                Property("projectTypeKey", StringType),
-                Property("name", StringType),
+    @classmethod
+    def _build_schema(cls) -> dict:
+        return PropertiesList(
+            Property("id", IntegerType),
+            Property("self", StringType),
+            Property("name", StringType),
+            Property("type", StringType),
+            Property(
+                "location",
+                ObjectType(
+                    Property("projectId", IntegerType),
+                    Property("displayName", StringType),
+                    Property("projectName", StringType),
+                    Property("projectKey", StringType),
+                    Property("projectTypeKey", StringType),
+                    Property("name", StringType),
+                ),
             ),
-        ),
-    ).to_dict()
+        ).to_dict()
 
-    @property
+    @functools.cached_property
     def url_base(self) -> str:
         domain = self.config["domain"]
         return "https://{}:443/rest/agile/1.0".format(domain)
@@ -3028,42 +1811,53 @@ class SprintStream(JiraStream):
     replication_key = "id"
     records_jsonpath = "$[values][*]"  # Or override `parse_response`.
     instance_name = "values"
-
-    schema = PropertiesList(
-        Property("id", IntegerType),
-        Property("self", StringType),
-        Property("state", StringType),
-        Property("name", StringType),
-        Property("startDate", StringType),
-        Property("endDate", StringType),
-        Property("completeDate", StringType),
-        Property("originBoardId", IntegerType),
-        Property("goal", StringType),
-        Property("boardId", IntegerType),
-    ).to_dict()
-
-    @property
+    context_fields = {"boardId": "board_id"}
+
+    @classmethod
+    def _build_schema(cls) -> dict:
+        return PropertiesList(
+            Property("id", IntegerType),
+            Property("self", StringType),
+            Property("state", StringType),
+            Property("name", StringType),
+            Property("startDate", StringType),
+            Property("endDate", StringType),
+            Property("completeDate", StringType),
+            Property("originBoardId", IntegerType),
+            Property("goal", StringType),
+            Property("boardId", IntegerType),
+        ).to_dict()
+
+    @functools.cached_property
     def url_base(self) -> str:
         domain = self.config["domain"]
         return "https://{}:443/rest/agile/1.0".format(domain)
 
-    def post_process(self, row: dict, context: dict) -> dict:
-        row["boardId"] = context["board_id"]
-        return row
+    def validate_response(self, response: requests.Response) -> None:
+        """
+        Boards that do not support sprints answer 400; treat them as empty
+        instead of failing the whole sync
+        """
+        if (
+            response.status_code == 400
+            and b"The board does not support sprints" in response.content
+        ):
+            return
+        super().validate_response(response)
 
-    def get_records(self, context: dict | None) -> Iterable[dict[str, Any]]:
-        try:
-            for record in self.request_records(context):
-                transformed_record = self.post_process(record, context)
-                if transformed_record is None:
-                    continue
-                yield transformed_record
-        except Exception as e:
-            pass
+
+class _ProjectRoleActor(JiraStream):
+    """
+    Helper stream for a single project/role pair; ``path`` is set per
+    instance by ProjectRoleActorStream
+    """
+
+    name = "project_role_actor"
+    path = ""
+    instance_name = ""
 
 
 class ProjectRoleActorStream(JiraStream):
-
     """
     https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-project-role-actors/#api-rest-api-3-role-id-actors-get
     """
@@ -3084,40 +1878,46 @@ class ProjectRoleActorStream(JiraStream):
     replication_method = "INCREMENTAL"
     records_jsonpath = "$[*]"  # Or override `parse_response`.
 
-    schema = PropertiesList(
-        Property("self", StringType),
-        Property("name", StringType),
-        Property("id", IntegerType),
-        Property("description", StringType),
-        Property(
-            "actors",
-            ArrayType(
+    @classmethod
+    def _build_schema(cls) -> dict:
+        return PropertiesList(
+            Property("self", StringType),
+            Property("name", StringType),
+            Property("id", IntegerType),
+            Property("description", StringType),
+            Property(
+                "actors",
+                ArrayType(
+                    ObjectType(
+                        Property("id", IntegerType),
+                        Property("displayName", StringType),
+                        Property("type", StringType),
+                        Property(
+                            "actorUser",
+                            ObjectType(
+                                Property("accountId", StringType),
+                            ),
+                        ),
+                    ),
+                ),
+            ),
+            Property(
+                "scope",
                 ObjectType(
-                    Property("id", IntegerType),
-                    Property("displayName", StringType),
                     Property("type", StringType),
                     Property(
-                        "actorUser",
+                        "project",
                         ObjectType(
-                            Property("accountId", StringType),
+                            Property("id", StringType),
                         ),
                     ),
                 ),
             ),
-        ),
-        Property(
-            "scope",
-            ObjectType(
-                Property("type", StringType),
-                Property(
-                    "project",
-                    ObjectType(
-                        Property("id", StringType),
-                    ),
-                ),
-            ),
-        ),
-    ).to_dict()
+        ).to_dict()
+
+    # Requests per (project, role) pair are independent and latency-bound,
+    # so they run on a bounded thread pool.
+    _MAX_WORKERS = 8
 
     def get_records(self, context: dict | None) -> Iterable[dict[str, Any]]:
         """
@@ -3125,47 +1925,30 @@ class ProjectRoleActorStream(JiraStream):
         list and gets data from the project role actor endpoint for each of the role ID's in the list
         """
 
-        role_id = []
-        project_id = []
-        role_actor_records = []
-
-        project = ProjectStream(self._tap, schema={"properties": {}})
-
-        for record in list(super().get_records(context)):
-            role_id.append(record.get("id"))
-
-        for record in list(project.get_records(context)):
-            project_id.append(record.get("id"))
+        project = ProjectStream(self._tap, schema=_EMPTY_SCHEMA)
 
-        for pid in project_id:
-            for role in role_id:
-                try:
+        role_id = [record.get("id") for record in super().get_records(context)]
+        project_id = [record.get("id") for record in project.get_records(context)]
 
-                    class ProjectRoleActor(JiraStream):
-                        role_id = role
-                        project_id = pid
-                        name = "project_role_actor"
-                        path = "/project/{}/role/{}".format(project_id, role_id)
-                        instance_name = ""
-
-                    project_role_actor = ProjectRoleActor(
-                        self._tap, schema={"properties": {}}
-                    )
-
-                    role_actor_records.append(
-                        list(project_role_actor.get_records(context))
-                    )
+        def fetch_role_actors(pid, role):
+            project_role_actor = _ProjectRoleActor(self._tap, schema=_EMPTY_SCHEMA)
+            project_role_actor.path = "/project/{}/role/{}".format(pid, role)
 
-                except:
-                    pass
+            try:
+                return list(project_role_actor.get_records(context))
+            except FatalAPIError:
+                # Not every role exists in every project; skip those pairs.
+                self.logger.debug("No role actors for project %s role %s", pid, role)
+                return []
 
-        project_role_actor_records = sum(role_actor_records, [])
+        pairs = [(pid, role) for pid in project_id for role in role_id]
 
-        return project_role_actor_records
+        with ThreadPoolExecutor(max_workers=self._MAX_WORKERS) as executor:
+            for records in executor.map(lambda pair: fetch_role_actors(*pair), pairs):
+                yield from records
 
 
 class AuditingStream(JiraStream):
-
     """
     https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-audit-records/#api-rest-api-3-auditing-record-get
     """
@@ -3187,38 +1970,19 @@ class AuditingStream(JiraStream):
     records_jsonpath = "$[records][*]"  # Or override `parse_response`.
     instance_name = "records"
 
-    schema = PropertiesList(
-        Property("id", IntegerType),
-        Property("summary", StringType),
-        Property("created", StringType),
-        Property("category", StringType),
-        Property("eventSource", StringType),
-        Property("remoteAddress", StringType),
-        Property("authorKey", StringType),
-        Property("authorAccountId", StringType),
-        Property(
-            "objectItem",
-            ObjectType(
-                Property("id", StringType),
-                Property("name", StringType),
-                Property("typeName", StringType),
-                Property("parentId", StringType),
-                Property("parentName", StringType),
-            ),
-        ),
-        Property(
-            "changedValues",
-            ArrayType(
-                ObjectType(
-                    Property("fieldName", StringType),
-                    Property("changedFrom", StringType),
-                    Property("changedTo", StringType),
-                ),
-            ),
-        ),
-        Property(
-            "associatedItems",
-            ArrayType(
+    @classmethod
+    def _build_schema(cls) -> dict:
+        return PropertiesList(
+            Property("id", IntegerType),
+            Property("summary", StringType),
+            Property("created", StringType),
+            Property("category", StringType),
+            Property("eventSource", StringType),
+            Property("remoteAddress", StringType),
+            Property("authorKey", StringType),
+            Property("authorAccountId", StringType),
+            Property(
+                "objectItem",
                 ObjectType(
                     Property("id", StringType),
                     Property("name", StringType),
@@ -3227,12 +1991,32 @@ class AuditingStream(JiraStream):
                     Property("parentName", StringType),
                 ),
             ),
-        ),
-    ).to_dict()
+            Property(
+                "changedValues",
+                ArrayType(
+                    ObjectType(
+                        Property("fieldName", StringType),
+                        Property("changedFrom", StringType),
+                        Property("changedTo", StringType),
+                    ),
+                ),
+            ),
+            Property(
+                "associatedItems",
+                ArrayType(
+                    ObjectType(
+                        Property("id", StringType),
+                        Property("name", StringType),
+                        Property("typeName", StringType),
+                        Property("parentId", StringType),
+                        Property("parentName", StringType),
+                    ),
+                ),
+            ),
+        ).to_dict()
 
 
 class DashboardStream(JiraStream):
-
     """
     https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-dashboards/#api-rest-api-3-dashboard-get
     """
@@ -3254,35 +2038,38 @@ class DashboardStream(JiraStream):
     records_jsonpath = "$[dashboards][*]"  # Or override `parse_response`.
     instance_name = "dashboards"
 
-    schema = PropertiesList(
-        Property("id", StringType),
-        Property("isFavourite", BooleanType),
-        Property("name", StringType),
-        Property("popularity", IntegerType),
-        Property("self", StringType),
-        Property(
-            "sharePermissions",
-            ArrayType(
-                ObjectType(
-                    Property("id", IntegerType),
-                    Property("type", StringType),
+    @classmethod
+    def _build_schema(cls) -> dict:
+        return PropertiesList(
+            Property("id", StringType),
+            Property("isFavourite", BooleanType),
+            Property("name", StringType),
+            Property("popularity", IntegerType),
+            Property("self", StringType),
+            Property(
+                "sharePermissions",
+                ArrayType(
+                    ObjectType(
+                        Property("id", IntegerType),
+                        Property("type", StringType),
+                    ),
                 ),
             ),
-        ),
-        Property(
-            "editPermissions",
-            ArrayType(
-                ObjectType(Property("id", IntegerType), Property("type", StringType))
+            Property(
+                "editPermissions",
+                ArrayType(
+                    ObjectType(
+                        Property("id", IntegerType), Property("type", StringType)
+                    )
+                ),
             ),
-        ),
-        Property("view", StringType),
-        Property("isWritable", BooleanType),
-        Property("systemDashboard", BooleanType),
-    ).to_dict()
+            Property("view", StringType),
+            Property("isWritable", BooleanType),
+            Property("systemDashboard", BooleanType),
+        ).to_dict()
 
 
 class FilterSearchStream(JiraStream):
-
     """
     https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-filters/#api-rest-api-3-filter-search-get
     """
@@ -3304,16 +2091,17 @@ class FilterSearchStream(JiraStream):
     records_jsonpath = "$[values][*]"  # Or override `parse_response`.
     instance_name = "values"
 
-    schema = PropertiesList(
-        Property("expand", StringType),
-        Property("self", StringType),
-        Property("id", StringType),
-        Property("name", StringType),
-    ).to_dict()
+    @classmethod
+    def _build_schema(cls) -> dict:
+        return PropertiesList(
+            Property("expand", StringType),
+            Property("self", StringType),
+            Property("id", StringType),
+            Property("name", StringType),
+        ).to_dict()
 
 
 class FilterDefaultShareScopeStream(JiraStream):
-
     """
     https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-filter-sharing/#api-rest-api-3-filter-defaultsharescope-get
     """
@@ -3333,13 +2121,14 @@ class FilterDefaultShareScopeStream(JiraStream):
     replication_method = "INCREMENTAL"
     instance_name = ""
 
-    schema = PropertiesList(
-        Property("scope", StringType),
-    ).to_dict()
+    @classmethod
+    def _build_schema(cls) -> dict:
+        return PropertiesList(
+            Property("scope", StringType),
+        ).to_dict()
 
 
 class GroupsPickerStream(JiraStream):
-
     """
     https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-groups/#api-rest-api-3-groups-picker-get
     """
@@ -3361,25 +2150,26 @@ class GroupsPickerStream(JiraStream):
     records_jsonpath = "$[groups][*]"  # Or override `parse_response`.
     instance_name = "groups"
 
-    schema = PropertiesList(
-        Property("name", StringType),
-        Property("html", StringType),
-        Property(
-            "labels",
-            ArrayType(
-                ObjectType(
-                    Property("text", StringType),
-                    Property("title", StringType),
-                    Property("type", StringType),
+    @classmethod
+    def _build_schema(cls) -> dict:
+        return PropertiesList(
+            Property("name", StringType),
+            Property("html", StringType),
+            Property(
+                "labels",
+                ArrayType(
+                    ObjectType(
+                        Property("text", StringType),
+                        Property("title", StringType),
+                        Property("type", StringType),
+                    ),
                 ),
             ),
-        ),
-        Property("groupId", StringType),
-    ).to_dict()
+            Property("groupId", StringType),
+        ).to_dict()
 
 
 class LicenseStream(JiraStream):
-
     """
     https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-license-metrics/#api-rest-api-3-instance-license-get
     """
@@ -3401,14 +2191,15 @@ class LicenseStream(JiraStream):
     records_jsonpath = "$[applications][*]"  # Or override `parse_response`.
     instance_name = "applications"
 
-    schema = PropertiesList(
-        Property("id", StringType),
-        Property("plan", StringType),
-    ).to_dict()
+    @classmethod
+    def _build_schema(cls) -> dict:
+        return PropertiesList(
+            Property("id", StringType),
+            Property("plan", StringType),
+        ).to_dict()
 
 
 class ScreensStream(JiraStream):
-
     """
     https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-screens/#api-rest-api-3-screens-get
     """
@@ -3430,27 +2221,28 @@ class ScreensStream(JiraStream):
     records_jsonpath = "$[values][*]"  # Or override `parse_response`.
     instance_name = "values"
 
-    schema = PropertiesList(
-        Property("id", IntegerType),
-        Property("name", StringType),
-        Property("description", StringType),
-        Property(
-            "scope",
-            ObjectType(
-                Property("type", StringType),
-                Property(
-                    "project",
-                    ObjectType(
-                        Property("id", StringType),
+    @classmethod
+    def _build_schema(cls) -> dict:
+        return PropertiesList(
+            Property("id", IntegerType),
+            Property("name", StringType),
+            Property("description", StringType),
+            Property(
+                "scope",
+                ObjectType(
+                    Property("type", StringType),
+                    Property(
+                        "project",
+                        ObjectType(
+                            Property("id", StringType),
+                        ),
                     ),
                 ),
             ),
-        ),
-    ).to_dict()
+        ).to_dict()
 
 
 class ScreenSchemesStream(JiraStream):
-
     """
     https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-screen-tab-fields/#api-rest-api-3-screens-screenid-tabs-tabid-fields-get
     """
@@ -3472,21 +2264,22 @@ class ScreenSchemesStream(JiraStream):
     records_jsonpath = "$[values][*]"  # Or override `parse_response`.
     instance_name = "values"
 
-    schema = PropertiesList(
-        Property("id", IntegerType),
-        Property("name", StringType),
-        Property("description", StringType),
-        Property(
-            "screens",
-            ObjectType(
-                Property("default", IntegerType), Property("create", IntegerType)
+    @classmethod
+    def _build_schema(cls) -> dict:
+        return PropertiesList(
+            Property("id", IntegerType),
+            Property("name", StringType),
+            Property("description", StringType),
+            Property(
+                "screens",
+                ObjectType(
+                    Property("default", IntegerType), Property("create", IntegerType)
+                ),
             ),
-        ),
-    ).to_dict()
+        ).to_dict()
 
 
 class StatusesSearchStream(JiraStream):
-
     """
     https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-screen-tab-fields/#api-rest-api-3-screens-screenid-tabs-tabid-fields-get
     """
@@ -3508,22 +2301,23 @@ class StatusesSearchStream(JiraStream):
     records_jsonpath = "$[values][*]"  # Or override `parse_response`.
     instance_name = "values"
 
-    schema = PropertiesList(
-        Property("id", StringType),
-        Property("name", StringType),
-        Property("statusCategory", StringType),
-        Property(
-            "scope",
-            ObjectType(Property("type", StringType)),
-        ),
-        Property("description", StringType),
-        Property("usages", ArrayType(StringType)),
-        Property("workflowUsages", ArrayType(StringType)),
-    ).to_dict()
+    @classmethod
+    def _build_schema(cls) -> dict:
+        return PropertiesList(
+            Property("id", StringType),
+            Property("name", StringType),
+            Property("statusCategory", StringType),
+            Property(
+                "scope",
+                ObjectType(Property("type", StringType)),
+            ),
+            Property("description", StringType),
+            Property("usages", ArrayType(StringType)),
+            Property("workflowUsages", ArrayType(StringType)),
+        ).to_dict()
 
 
 class WorkflowStream(JiraStream):
-
     """
     https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-workflows/#api-rest-api-3-workflow-get
     """
@@ -3543,27 +2337,29 @@ class WorkflowStream(JiraStream):
     replication_method = "INCREMENTAL"
     instance_name = ""
 
-    schema = PropertiesList(
-        Property("name", StringType),
-        Property("description", StringType),
-        Property("steps", IntegerType),
-        Property("default", BooleanType),
-        Property("lastModifiedDate", StringType),
-        Property("lastModifiedUser", StringType),
-        Property("lastModifiedUserAccountId", StringType),
-        Property(
-            "scope",
-            ObjectType(
-                Property("type", StringType),
-                Property(
-                    "project",
-                    ObjectType(
-                        Property("id", StringType),
+    @classmethod
+    def _build_schema(cls) -> dict:
+        return PropertiesList(
+            Property("name", StringType),
+            Property("description", StringType),
+            Property("steps", IntegerType),
+            Property("default", BooleanType),
+            Property("lastModifiedDate", StringType),
+            Property("lastModifiedUser", StringType),
+            Property("lastModifiedUserAccountId", StringType),
+            Property(
+                "scope",
+                ObjectType(
+                    Property("type", StringType),
+                    Property(
+                        "project",
+                        ObjectType(
+                            Property("id", StringType),
+                        ),
                     ),
                 ),
             ),
-        ),
-    ).to_dict()
+        ).to_dict()
 
 
 class Resolutions(JiraStream):
@@ -3590,16 +2386,17 @@ class Resolutions(JiraStream):
 
     instance_name = "values"
 
-    schema = PropertiesList(
-        Property("id", StringType),
-        Property("description", StringType),
-        Property("name", StringType),
-        Property("isDefault", BooleanType),
-    ).to_dict()
+    @classmethod
+    def _build_schema(cls) -> dict:
+        return PropertiesList(
+            Property("id", StringType),
+            Property("description", StringType),
+            Property("name", StringType),
+            Property("isDefault", BooleanType),
+        ).to_dict()
 
 
 class WorkflowSearchStream(JiraStream):
-
     """
     https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-workflows/#api-rest-api-3-workflow-get
     """
@@ -3621,25 +2418,26 @@ class WorkflowSearchStream(JiraStream):
     records_jsonpath = "$[values][*]"  # Or override `parse_response`.
     instance_name = "values"
 
-    schema = PropertiesList(
-        Property(
-            "id",
-            ObjectType(
-                Property("name", StringType),
-                Property("entityId", StringType),
+    @classmethod
+    def _build_schema(cls) -> dict:
+        return PropertiesList(
+            Property(
+                "id",
+                ObjectType(
+                    Property("name", StringType),
+                    Property("entityId", StringType),
+                ),
             ),
-        ),
-        Property("description", StringType),
-        Property("created", StringType),
-        Property("updated", StringType),
-    ).to_dict()
+            Property("description", StringType),
+            Property("created", StringType),
+            Property("updated", StringType),
+        ).to_dict()
 
 
 # Child Streams
 
 
 class IssueWatchersStream(JiraStream):
-
     """
     https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-workflows/#api-rest-api-3-workflow-get
     """
@@ -3660,31 +2458,29 @@ class IssueWatchersStream(JiraStream):
     primary_keys = ["id"]
     records_jsonpath = "$[*]"  # Or override `parse_response`.
     instance_name = ""
+    context_fields = {"issueId": "issue_id"}
 
-    schema = PropertiesList(
-        Property("self", StringType),
-        Property("watchCount", IntegerType),
-        Property(
-            "watchers",
-            ArrayType(
-                ObjectType(
-                    Property("accountId", StringType),
-                    Property("accountType", StringType),
-                    Property("active", BooleanType),
-                    Property("displayName", StringType),
-                )
+    @classmethod
+    def _build_schema(cls) -> dict:
+        return PropertiesList(
+            Property("self", StringType),
+            Property("watchCount", IntegerType),
+            Property(
+                "watchers",
+                ArrayType(
+                    ObjectType(
+                        Property("accountId", StringType),
+                        Property("accountType", StringType),
+                        Property("active", BooleanType),
+                        Property("displayName", StringType),
+                    )
+                ),
             ),
-        ),
-        Property("issueId", StringType),
-    ).to_dict()
-
-    def post_process(self, row: dict, context: dict) -> dict:
-        row["issueId"] = context["issue_id"]
-        return row
+            Property("issueId", StringType),
+        ).to_dict()
 
 
 class IssueChangeLogStream(JiraStream):
-
     """
     https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-workflows/#api-rest-api-3-workflow-get
     """
@@ -3716,34 +2512,33 @@ class IssueChangeLogStream(JiraStream):
 
     next_page_token_jsonpath = None
 
-    schema = PropertiesList(
-        Property("id", StringType),
-        Property("issueId", StringType),
-        Property("author", ObjectType(Property("accountId", StringType))),
-        Property("created", DateTimeType),
-        Property(
-            "items",
-            ArrayType(
-                ObjectType(
-                    Property("field", StringType),
-                    Property("fieldtype", StringType),
-                    Property("fieldId", StringType),
-                    Property("from", StringType),
-                    Property("fromString", StringType),
-                    Property("to", StringType),
-                    Property("toString", StringType),
-                )
-            ),
-        ),
-    ).to_dict()
+    context_fields = {"issueId": "issue_id"}
 
-    def post_process(self, row: dict, context: dict) -> dict:
-        row["issueId"] = context["issue_id"]
-        return row
+    @classmethod
+    def _build_schema(cls) -> dict:
+        return PropertiesList(
+            Property("id", StringType),
+            Property("issueId", StringType),
+            Property("author", ObjectType(Property("accountId", StringType))),
+            Property("created", DateTimeType),
+            Property(
+                "items",
+                ArrayType(
+                    ObjectType(
+                        Property("field", StringType),
+                        Property("fieldtype", StringType),
+                        Property("fieldId", StringType),
+                        Property("from", StringType),
+                        Property("fromString", StringType),
+                        Property("to", StringType),
+                        Property("toString", StringType),
+                    )
+                ),
+            ),
+        ).to_dict()
 
 
 class IssueComments(JiraStream):
-
     """
     https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-issue-comments/#api-rest-api-3-issue-issueidorkey-comment-get
     """
@@ -3773,59 +2568,49 @@ class IssueComments(JiraStream):
 
     next_page_token_jsonpath = None
 
-    schema = PropertiesList(
-        Property("id", StringType),
-        Property("issueId", StringType),
-        Property("self", StringType),
-        Property(
-            "author",
-            ObjectType(
-                Property("accountId", StringType),
-                Property("self", StringType),
-                Property("displayName", StringType),
-                Property("active", BooleanType),
+    context_fields = {"issueId": "issue_id"}
+
+    @classmethod
+    def _build_schema(cls) -> dict:
+        return PropertiesList(
+            Property("id", StringType),
+            Property("issueId", StringType),
+            Property("self", StringType),
+            Property(
+                "author",
+                _AUTHOR,
             ),
-        ),
-        Property("created", DateTimeType),
-        Property("updated", DateTimeType),
-        Property(
-            "body",
-            ObjectType(
-                Property("type", StringType),
-                Property("version", IntegerType),
-                Property(
-                    "content",
-                    ArrayType(
-                        ObjectType(
-                            Property("type", StringType),
-                            Property(
-                                "content",
-                                ArrayType(
-                                    ObjectType(
-                                        Property("type", StringType),
-                                        Property("text", StringType),
-                                    )
+            Property("created", DateTimeType),
+            Property("updated", DateTimeType),
+            Property(
+                "body",
+                ObjectType(
+                    Property("type", StringType),
+                    Property("version", IntegerType),
+                    Property(
+                        "content",
+                        ArrayType(
+                            ObjectType(
+                                Property("type", StringType),
+                                Property(
+                                    "content",
+                                    ArrayType(
+                                        ObjectType(
+                                            Property("type", StringType),
+                                            Property("text", StringType),
+                                        )
+                                    ),
                                 ),
-                            ),
-                        )
+                            )
+                        ),
                     ),
                 ),
             ),
-        ),
-        Property(
-            "updateAuthor",
-            ObjectType(
-                Property("accountId", StringType),
-                Property("self", StringType),
-                Property("displayName", StringType),
-                Property("active", BooleanType),
+            Property(
+                "updateAuthor",
+                _AUTHOR,
             ),
-        ),
-    ).to_dict()
-
-    def post_process(self, row: dict, context: dict) -> dict:
-        row["issueId"] = context["issue_id"]
-        return row
+        ).to_dict()
 
 
 class IssueWorklogs(JiraStream):
@@ -3858,29 +2643,21 @@ class IssueWorklogs(JiraStream):
 
     next_page_token_jsonpath = None
 
-    schema = PropertiesList(
-        Property("id", StringType),
-        Property("self", StringType),
-        Property(
-            "author",
-            ObjectType(
-                Property("accountId", StringType),
-                Property("self", StringType),
-                Property("displayName", StringType),
-                Property("active", BooleanType),
+    @classmethod
+    def _build_schema(cls) -> dict:
+        return PropertiesList(
+            Property("id", StringType),
+            Property("self", StringType),
+            Property(
+                "author",
+                _AUTHOR,
             ),
-        ),
-        Property(
-            "updateAuthor",
-            ObjectType(
-                Property("accountId", StringType),
-                Property("self", StringType),
-                Property("displayName", StringType),
-                Property("active", BooleanType),
+            Property(
+                "updateAuthor",
+                _AUTHOR,
             ),
-        ),
-        Property("updated", DateTimeType),
-        Property("started", DateTimeType),
-        Property("timeSpentSeconds", IntegerType),
-        Property("issueId", StringType),
-    ).to_dict()
+            Property("updated", DateTimeType),
+            Property("started", DateTimeType),
+            Property("timeSpentSeconds", IntegerType),
+            Property("issueId", StringType),
+        ).to_dict()
@@ -48,10 +48,53 @@ class TapJira(Tap):
             ),
             required=True,
         ),
+        th.Property(
+            "adf_full_schema",
+            th.BooleanType,
+            description=(
+                "Type every known ADF attrs key in the issues schema; "
+                "disable to emit a compact untyped object instead"
+            ),
+            default=True,
+        ),
+        th.Property(
+            "adf_mode",
+            th.StringType,
+            description=(
+                "How to emit ADF rich-text issue descriptions: 'nested' keeps "
+                "the typed document tree, 'json_string' serializes it to one "
+                "JSON string column"
+            ),
+            default="nested",
+            allowed_values=["nested", "json_string"],
+        ),
+        th.Property(
+            "stream_options",
+            th.ObjectType(
+                th.Property(
+                    "issues",
+                    th.ObjectType(
+                        th.Property(
+                            "fields",
+                            th.ArrayType(th.StringType),
+                            description=(
+                                "Issue fields to request and emit; "
+                                "all fields when omitted"
+                            ),
+                        ),
+                    ),
+                ),
+            ),
+        ),
         th.Property(
             "page_size",
             th.ObjectType(
-                th.Property("issues", th.IntegerType, description="Page size for issues stream", default=100),
+                th.Property(
+                    "issues",
+                    th.IntegerType,
+                    description="Page size for issues stream",
+                    default=100,
+                ),
             ),
         ),
     ).to_dict()
@@ -0,0 +1,39 @@
+"""Tests for the JiraStream response-parsing paths."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from tap_jira.client import JiraStream, ijson
+from tap_jira.tap import TapJira
+
+SAMPLE_CONFIG = {
+    "domain": "example.atlassian.net",
+    "auth": {
+        "flow": "password",
+        "username": "user",
+        "password": "secret",
+    },
+}
+
+
+def _fake_response(payload):
+    body = json.dumps(payload).encode()
+    return SimpleNamespace(content=body, json=lambda: payload)
+
+
+@pytest.mark.skipif(ijson is None, reason="ijson not installed")
+def test_streamed_page_parses_numbers_as_floats():
+    tap = TapJira(config=SAMPLE_CONFIG, validate_config=False)
+    issues = tap.streams["issues"]
+    record = {"id": "1", "fields": {"customfield_10016": 1.5}}
+    padding = "x" * JiraStream._STREAM_PARSE_MIN_BYTES
+    payload = {"issues": [record], "padding": padding}
+    response = _fake_response(payload)
+    assert len(response.content) >= JiraStream._STREAM_PARSE_MIN_BYTES
+
+    (parsed,) = issues.parse_response(response)
+    value = parsed["fields"]["customfield_10016"]
+    assert type(value) is float
+    assert value == 1.5
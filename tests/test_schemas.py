@@ -0,0 +1,23 @@
+"""Guard that pre-serialized schema files match the typing-helper builders."""
+
+import json
+
+from tap_jira import streams
+from tap_jira.client import SCHEMAS_DIR, JiraStream
+
+
+def test_pregenerated_schemas_match_builders():
+    paths = list(SCHEMAS_DIR.glob("*.json"))
+    assert paths, "no pre-serialized schemas found"
+    classes = {
+        cls.name: cls
+        for cls in vars(streams).values()
+        if isinstance(cls, type)
+        and issubclass(cls, JiraStream)
+        and "name" in vars(cls)
+    }
+    for path in paths:
+        built = classes[path.stem]._build_schema()
+        assert built == json.loads(path.read_text()), (
+            f"{path.name} is stale; re-run tools/gen_schemas.py"
+        )
@@ -0,0 +1,40 @@
+"""Pre-serialize stream schemas to JSON files under ``tap_jira/schemas``.
+
+Streams whose schema file exists are loaded from JSON at runtime instead of
+re-running the ``singer_sdk.typing`` builder tree. Re-run this script after
+editing a pre-serialized stream's ``_build_schema`` definition; the test
+suite fails if the two drift apart.
+
+Usage: python tools/gen_schemas.py [stream_name ...]   (default: issues)
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tap_jira import streams  # noqa: E402
+from tap_jira.client import SCHEMAS_DIR, JiraStream  # noqa: E402
+
+
+def main(names: list[str]) -> None:
+    classes = {
+        cls.name: cls
+        for cls in vars(streams).values()
+        if isinstance(cls, type)
+        and issubclass(cls, JiraStream)
+        and "name" in vars(cls)
+    }
+    SCHEMAS_DIR.mkdir(exist_ok=True)
+    for name in names:
+        schema = classes[name]._build_schema()
+        path = SCHEMAS_DIR / f"{name}.json"
+        path.write_text(json.dumps(schema, indent=1, sort_keys=True) + "\n")
+        print(f"wrote {path}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or ["issues"])